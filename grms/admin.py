@@ -47,11 +47,9 @@ from . import admin_geojson, admin_reports
 from .services import map_services, mci_intervention, prioritization, workplan_costs
 from .services.planning import road_ranking, workplans
 from .utils import (
-    _extract_coordinates,
-    _haversine_km,
-    geometry_length_km,
     geos_length_km,
     make_point,
+    point_at_chainage,
     point_to_lat_lng,
     slice_geometry_by_chainage,
     slice_linestring_by_chainage,
@@ -319,33 +317,21 @@ def _segment_feature(segment: models.RoadSegment | None, line_geom=None, reasons
     )
 
 
-def _interpolate_point_on_line(geom, station_km: float):
+def _interpolate_point_on_line(geom, station_km: float, total_km: float | None = None):
     if not geom:
         return None
     if hasattr(geom, "interpolate"):
-        total_km = geos_length_km(geom)
+        if total_km is None:
+            total_km = geos_length_km(geom)
         if total_km <= 0:
             return None
         fraction = min(1.0, max(0.0, float(station_km) / float(total_km)))
         return geom.interpolate(fraction, normalized=True)
 
-    coordinates = _extract_coordinates(geom)
-    if len(coordinates) < 2:
+    point = point_at_chainage(geom, station_km)
+    if point is None:
         return None
-    total_km = geometry_length_km(geom)
-    if total_km <= 0:
-        return None
-    target_km = min(float(station_km), total_km)
-    cumulative = 0.0
-    for start, end in zip(coordinates[:-1], coordinates[1:]):
-        segment_km = _haversine_km(start, end)
-        if cumulative + segment_km >= target_km:
-            fraction = (target_km - cumulative) / segment_km if segment_km else 0.0
-            lon = start[0] + (end[0] - start[0]) * fraction
-            lat = start[1] + (end[1] - start[1]) * fraction
-            return {"type": "Point", "coordinates": [lon, lat], "srid": 4326}
-        cumulative += segment_km
-    lon, lat = coordinates[-1]
+    lon, lat = point
     return {"type": "Point", "coordinates": [lon, lat], "srid": 4326}
 
 
@@ -394,6 +380,9 @@ def _structure_features_for_context(road_id: int, section_id: int | None = None,
     )
     features = []
     local_reasons = reasons if reasons is not None else []
+    # Metric length of line_geom, measured on first use and shared by every
+    # structure that is placed by chainage.
+    line_total_km = None
     for structure in qs:
         geometry = _geometry_from_instance(structure, "location_point", local_reasons)
         if not geometry:
@@ -438,7 +427,9 @@ def _structure_features_for_context(road_id: int, section_id: int | None = None,
                 if not line_geom:
                     local_reasons.append("missing_parent_geom")
                 else:
-                    derived = _interpolate_point_on_line(line_geom, station_km)
+                    if line_total_km is None and hasattr(line_geom, "interpolate"):
+                        line_total_km = geos_length_km(line_geom)
+                    derived = _interpolate_point_on_line(line_geom, station_km, line_total_km)
                     if derived:
                         geometry = _serialize_geometry(_ensure_wgs84(derived, local_reasons))
         if not geometry:
@@ -168,7 +168,14 @@ class CascadeSectionSegmentMixin(CascadeRoadSectionMixin):
         if segment_field_name:
             validate_segment_belongs_to_section(section, segment, field=segment_field_name)
             road = cleaned.get(self.road_field_name)
-            validate_segment_belongs_to_road(road, segment, field=segment_field_name)
+            # The section check above guarantees the selected section is the
+            # segment's parent, so reuse its road id instead of re-fetching it.
+            validate_segment_belongs_to_road(
+                road,
+                segment,
+                field=segment_field_name,
+                section_road_id=section.road_id if section else None,
+            )
         return cleaned
 
 
@@ -221,7 +228,10 @@ class CascadeRoadSectionAssetMixin(CascadeRoadSectionMixin):
             if section:
                 validate_structure_belongs_to_section(section, asset)
         elif self.asset_field_name == "furniture":
-            validate_furniture_belongs_to_road(road, asset)
+            section_road_id = None
+            if section and asset and asset.section_id == section.id:
+                section_road_id = section.road_id
+            validate_furniture_belongs_to_road(road, asset, section_road_id=section_road_id)
             if section:
                 validate_furniture_belongs_to_section(section, asset)
         return cleaned
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class GrmsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'grms'
+
+    def ready(self):  # pragma: no cover - side effect registration
+        from . import signals  # noqa: F401
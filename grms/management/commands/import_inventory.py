@@ -12,6 +12,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from grms.models import Road, RoadNameAlias, RoadSection, RoadSegment, StructureInventory
+from grms.signals import bump_map_geojson_version
 from traffic.models import TrafficSurveyOverall, TrafficSurveySummary
 
 
@@ -196,6 +197,8 @@ class Command(BaseCommand):
             self.stdout.write("Importing cross-section CSV...")
             with transaction.atomic():
                 counts = self._import_cross_section(cross_section_path)
+                # bulk_update() skips the signals that expire the cached map.
+                transaction.on_commit(bump_map_geojson_version)
                 if dry_run:
                     transaction.set_rollback(True)
             self.stdout.write(self._format_counts("Cross-section", counts))
@@ -206,6 +209,8 @@ class Command(BaseCommand):
             self.stdout.write("Importing structures CSV...")
             with transaction.atomic():
                 counts = self._import_structures(structures_path)
+                # bulk_update() skips the signals that expire the cached map.
+                transaction.on_commit(bump_map_geojson_version)
                 if dry_run:
                     transaction.set_rollback(True)
             self.stdout.write(self._format_counts("Structures", counts))
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("grms", "0055_remove_legacy_traffic_models"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="roadconditionsurvey",
+            index=models.Index(
+                fields=["road_segment", "-inspection_date"],
+                name="grms_roadco_road_se_d000bb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="prioritizationresult",
+            index=models.Index(
+                fields=["fiscal_year", "priority_rank"],
+                name="grms_priori_fiscal__252f29_idx",
+            ),
+        ),
+    ]
@@ -1993,6 +1993,9 @@ class RoadConditionSurvey(models.Model):
 
     class Meta:
         ordering = ["-inspection_date", "road_segment"]
+        indexes = [
+            models.Index(fields=["road_segment", "-inspection_date"]),
+        ]
 
     def clean(self):
         seg = self.road_segment
@@ -2789,6 +2792,9 @@ class PrioritizationResult(models.Model):
         verbose_name = "Prioritization result"
         verbose_name_plural = "Prioritization results"
         ordering = ["fiscal_year", "priority_rank"]
+        indexes = [
+            models.Index(fields=["fiscal_year", "priority_rank"]),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"Priority {self.priority_rank} for road {self.road_id} ({self.fiscal_year})"
@@ -95,6 +95,11 @@ class RoadRouteRequestSerializer(serializers.Serializer):
         return mode
 
 
+class RoadMapContextBulkSerializer(serializers.Serializer):
+    # Bounded so one request cannot build an arbitrarily long pk__in list.
+    road_ids = serializers.ListField(child=serializers.IntegerField(), max_length=500)
+
+
 class LineStringGeometrySerializer(serializers.Serializer):
     coordinates = serializers.ListField(
         child=serializers.ListField(
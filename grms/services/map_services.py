@@ -7,10 +7,17 @@ import json
 from typing import Any, Dict, List, Optional
 from urllib import error, parse, request
 
+from django.core.cache import cache
+
 OSRM_URL = "https://router.project-osrm.org/route/v1"
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 USER_AGENT = "GRMS/1.0 (https://github.com/WorldBank-Transport/GRMS)"
 
+# Admin boundaries rarely change, so geocoded viewports are kept for a day.
+VIEWPORT_CACHE_SECONDS = 24 * 60 * 60
+# Routes between saved road endpoints are re-requested on every map render.
+DIRECTIONS_CACHE_SECONDS = 60 * 60
+
 TRAVEL_MODES = {"DRIVING", "WALKING", "BICYCLING"}
 OSRM_PROFILES = {"DRIVING": "driving", "WALKING": "walking", "BICYCLING": "cycling"}
 
@@ -122,7 +129,7 @@ def get_admin_area_viewport_or_default(
         return get_default_map_region()
 
     try:
-        region = get_admin_area_viewport(zone_name=zone_name, woreda_name=woreda_name)
+        region = get_cached_admin_area_viewport(zone_name, woreda_name)
     except MapServiceError:
         return get_default_map_region()
 
@@ -137,6 +144,21 @@ def get_admin_area_viewport_or_default(
     return region
 
 
+def get_cached_admin_area_viewport(zone_name: Optional[str], woreda_name: Optional[str] = None) -> Dict[str, Any]:
+    """Return :func:`get_admin_area_viewport`, cached per zone/woreda pair.
+
+    Failures raise :class:`MapServiceError` and are not cached, so a transient
+    outage is retried on the next request.
+    """
+
+    cache_key = f"grms:viewport:{parse.quote(zone_name or '')}:{parse.quote(woreda_name or '')}"
+    region = cache.get(cache_key)
+    if region is None:
+        region = get_admin_area_viewport(zone_name=zone_name, woreda_name=woreda_name)
+        cache.set(cache_key, region, VIEWPORT_CACHE_SECONDS)
+    return region
+
+
 def get_directions(
     *, start_lat: float, start_lng: float, end_lat: float, end_lng: float, travel_mode: str = "DRIVING"
 ) -> Dict[str, Any]:
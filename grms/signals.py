@@ -0,0 +1,75 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    ActivityLookup,
+    DistressType,
+    InterventionLookup,
+    Road,
+    RoadSection,
+    RoadSegment,
+    StructureInventory,
+)
+
+# Lookup tables only change through the admin or the API, both of which fire
+# the signals below; the timeout is a backstop for queryset.update() and
+# bulk loads that bypass them. Both response caches below are only used with
+# settings.SHARED_CACHE, since an invalidation has to reach every worker.
+LOOKUP_LIST_CACHE_SECONDS = 60 * 60
+LOOKUP_LIST_MODELS = (ActivityLookup, DistressType, InterventionLookup)
+
+# Map data is mostly bulk-loaded, so the import commands and the alignment
+# endpoint call bump_map_geojson_version() themselves after their
+# queryset.update()/bulk_update() writes, which fire no signals.
+MAP_GEOJSON_CACHE_SECONDS = 60 * 60
+MAP_GEOJSON_VERSION_KEY = "grms:map-geojson:version"
+
+
+def response_cache_enabled() -> bool:
+    """Whether cached API responses can be invalidated across processes."""
+
+    return getattr(settings, "SHARED_CACHE", False)
+
+
+def lookup_list_cache_key(model) -> str:
+    return f"grms:lookup-list:{model._meta.label_lower}"
+
+
+def map_geojson_version() -> int:
+    """Return the token embedded in cached map GeoJSON keys."""
+
+    # Seeded from the clock rather than 1 so an evicted version key can never
+    # come back as a value that older payloads are still stored under.
+    return cache.get_or_set(MAP_GEOJSON_VERSION_KEY, time.time_ns, None)
+
+
+def bump_map_geojson_version() -> None:
+    """Invalidate every cached map GeoJSON payload."""
+
+    cache.set(MAP_GEOJSON_VERSION_KEY, time.time_ns(), None)
+
+
+@receiver(post_save, sender=ActivityLookup)
+@receiver(post_save, sender=DistressType)
+@receiver(post_save, sender=InterventionLookup)
+@receiver(post_delete, sender=ActivityLookup)
+@receiver(post_delete, sender=DistressType)
+@receiver(post_delete, sender=InterventionLookup)
+def _invalidate_lookup_list(sender, **kwargs):
+    cache.delete(lookup_list_cache_key(sender))
+
+
+@receiver(post_save, sender=Road)
+@receiver(post_save, sender=RoadSection)
+@receiver(post_save, sender=RoadSegment)
+@receiver(post_save, sender=StructureInventory)
+@receiver(post_delete, sender=Road)
+@receiver(post_delete, sender=RoadSection)
+@receiver(post_delete, sender=RoadSegment)
+@receiver(post_delete, sender=StructureInventory)
+def _invalidate_map_geojson(sender, **kwargs):
+    bump_map_geojson_version()
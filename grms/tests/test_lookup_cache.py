@@ -0,0 +1,70 @@
+"""Tests for the cached lookup list endpoints."""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from grms import models
+
+
+@override_settings(SHARED_CACHE=True)
+class LookupListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(username="surveyor", password="pass")
+        self.client.force_authenticate(user)
+        self.url = reverse("distresstype-list")
+        models.DistressType.objects.create(distress_code="PH", distress_name="Pothole", category="road")
+
+    def test_matching_etag_returns_not_modified(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["distress_code"] for row in first.data], ["PH"])
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_saving_a_row_invalidates_the_cached_list(self):
+        first = self.client.get(self.url)
+        models.DistressType.objects.create(distress_code="RV", distress_name="Ravelling", category="road")
+
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+        self.assertEqual(len(second.data), 2)
+
+    def test_etag_differs_per_rendered_format(self):
+        as_json = self.client.get(self.url, HTTP_ACCEPT="application/json")
+        as_html = self.client.get(self.url, HTTP_ACCEPT="text/html", HTTP_IF_NONE_MATCH=as_json["ETag"])
+
+        self.assertEqual(as_html.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(as_html["ETag"], as_json["ETag"])
+        self.assertIn("Accept", as_html["Vary"])
+
+
+class LookupListWithoutSharedCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(username="surveyor", password="pass")
+        self.client.force_authenticate(user)
+        self.url = reverse("distresstype-list")
+        self.row = models.DistressType.objects.create(distress_code="PH", distress_name="Pothole", category="road")
+
+    def test_list_is_rebuilt_per_request(self):
+        first = self.client.get(self.url)
+
+        # queryset.update() fires no signal; another worker's write looks the same.
+        models.DistressType.objects.filter(pk=self.row.pk).update(distress_name="Deep pothole")
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data[0]["distress_name"], "Deep pothole")
+
+        third = self.client.get(self.url, HTTP_IF_NONE_MATCH=second["ETag"])
+        self.assertEqual(third.status_code, status.HTTP_304_NOT_MODIFIED)
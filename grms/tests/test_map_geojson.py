@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from grms import models
@@ -21,6 +22,7 @@ def _make_linestring():
 
 class MapGeoJSONTests(TestCase):
     def setUp(self):
+        cache.clear()
         user_model = get_user_model()
         self.user = user_model.objects.create_superuser(
             username="admin",
@@ -144,3 +146,36 @@ class MapGeoJSONTests(TestCase):
         self.assertEqual(structure_ids, {self.structure_a.id})
         roles = {f.get("properties", {}).get("role") for f in features}
         self.assertIn("structure_current", roles)
+
+    @override_settings(SHARED_CACHE=True)
+    def test_structure_geojson_is_cached_until_a_structure_changes(self):
+        url = reverse("map_section_structures_current", args=[self.road.id, self.section_a.id, self.structure_a.id])
+        first = self.client.get(url).json()
+
+        with self.assertNumQueries(2):  # session and user lookups only
+            self.assertEqual(self.client.get(url).json(), first)
+
+        self.structure_a.location_point = make_point(13.56, 39.06)
+        self.structure_a.save()
+        refreshed = self.client.get(url).json()
+        self.assertNotEqual(refreshed, first)
+
+    def test_road_sections_geojson_honours_if_none_match(self):
+        url = reverse("map_road_sections_current", args=[self.road.id, self.section_a.id])
+        first = self.client.get(url)
+
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_structure_geojson_is_rebuilt_without_a_shared_cache(self):
+        url = reverse("map_section_structures_current", args=[self.road.id, self.section_a.id, self.structure_a.id])
+        first = self.client.get(url)
+
+        # queryset.update() fires no signal; another worker's write looks the same.
+        models.StructureInventory.objects.filter(pk=self.structure_a.pk).update(
+            location_point=make_point(13.56, 39.06)
+        )
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second.json(), first.json())
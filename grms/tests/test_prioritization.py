@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
@@ -12,6 +13,7 @@ from rest_framework.test import APIClient, APITestCase
 
 from grms import models
 from grms.utils import make_point, utm_to_wgs84
+from grms.views import PrioritizationResultPagination
 from traffic import models as traffic_models
 
 
@@ -246,3 +248,50 @@ class PrioritizationViewTests(RoadNetworkMixin, APITestCase):
         result = models.SegmentMCIResult.objects.get(road_segment__section__road=road)
         expected = self._expected_score(float(result.mci_value), 120.0, 55.0, weights, 120.0, 120.0)
         self.assertEqual(Decimal(data[0]["ranking_index"]), expected)
+
+
+class PrioritizationResultListTests(APITestCase):
+    def setUp(self):
+        zone = models.AdminZone.objects.create(name="Zone")
+        road = models.Road.objects.create(
+            road_name_from="Start",
+            road_name_to="End",
+            design_standard="DC1",
+            admin_zone=zone,
+            total_length_km=Decimal("10.0"),
+            surface_type="Earth",
+            managing_authority="Federal",
+        )
+        models.PrioritizationResult.objects.bulk_create(
+            models.PrioritizationResult(
+                road=road,
+                fiscal_year=2024,
+                improvement_cost=Decimal("1000.00"),
+                ranking_index=Decimal("1.0"),
+                priority_rank=rank,
+            )
+            for rank in range(1, 6)
+        )
+        self.url = reverse("prioritizationresult-list")
+
+    def test_plain_list_returns_an_array(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual([row["priority_rank"] for row in response.json()], [1, 2, 3, 4, 5])
+
+    def test_page_params_return_a_page(self):
+        response = self.client.get(self.url, {"page": 2, "page_size": 2})
+
+        payload = response.json()
+        self.assertEqual(set(payload), {"count", "next", "previous", "results"})
+        self.assertEqual(payload["count"], 5)
+        self.assertEqual([row["priority_rank"] for row in payload["results"]], [3, 4])
+
+    def test_page_size_is_clamped_to_the_maximum(self):
+        with mock.patch.object(PrioritizationResultPagination, "max_page_size", 3):
+            response = self.client.get(self.url, {"page_size": 50})
+
+        self.assertEqual(len(response.json()["results"]), 3)
+        self.assertIsNotNone(response.json()["next"])
@@ -6,6 +6,7 @@ from unittest import mock
 
 from decimal import Decimal
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -18,6 +19,20 @@ from grms.tests.test_prioritization import RoadNetworkMixin
 class RoutePlanningTests(RoadNetworkMixin, APITestCase):
     """Integration-style tests for the road route endpoint."""
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    @mock.patch("grms.services.map_services.get_admin_area_viewport")
+    def test_map_context_reuses_cached_viewport(self, mock_geo):
+        mock_geo.return_value = {"center": {"lat": 13.5, "lng": 39.5}, "viewport": None, "bounds": None}
+        road, _, _ = self.create_network("Cached")
+        url = reverse("road_map_context", args=[road.id])
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        mock_geo.assert_called_once()
+
     def test_missing_coordinates_return_validation_error(self):
         road, _, _ = self.create_network("Missing")
         url = reverse("road_route", args=[road.id])
@@ -86,6 +101,22 @@ class RoutePlanningTests(RoadNetworkMixin, APITestCase):
         self.assertEqual(payload["start"], {"lat": 13.0, "lng": 39.0})
         self.assertEqual(payload["end"], {"lat": 13.5, "lng": 39.5})
 
+    @mock.patch("grms.services.map_services.get_directions")
+    def test_get_route_reuses_cached_directions(self, mock_get):
+        mock_get.return_value = {"distance_meters": 1000}
+        road, _, _ = self.create_network("CachedRoute")
+        road.road_start_coordinates = {"type": "Point", "coordinates": [39.0, 13.0], "srid": 4326}
+        road.road_end_coordinates = {"type": "Point", "coordinates": [39.5, 13.5], "srid": 4326}
+        road.save(update_fields=["road_start_coordinates", "road_end_coordinates"])
+
+        url = reverse("road_route", args=[road.id])
+        first = self.client.get(url)
+        second = self.client.get(url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.json()["route"], first.json()["route"])
+        mock_get.assert_called_once()
+
     def test_get_route_returns_error_when_coordinates_missing(self):
         road, _, _ = self.create_network("MissingSaved")
         url = reverse("road_route", args=[road.id])
@@ -156,6 +187,41 @@ class RoutePlanningTests(RoadNetworkMixin, APITestCase):
         self.assertIn("detail", response.json())
         mock_geo.assert_not_called()
 
+    @mock.patch("grms.services.map_services.get_admin_area_viewport")
+    def test_bulk_map_context_returns_context_per_road(self, mock_geo):
+        mock_geo.return_value = {"center": {"lat": 13.5, "lng": 39.5}, "viewport": None, "bounds": None}
+        first, _, _ = self.create_network("BulkOne")
+        second, _, _ = self.create_network("BulkTwo")
+
+        url = reverse("road_map_context_bulk")
+        response = self.client.post(url, {"road_ids": [first.id, second.id]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(set(results), {str(first.id), str(second.id)})
+        self.assertEqual(results[str(first.id)]["road"]["id"], first.id)
+        self.assertEqual(results[str(second.id)]["zone"], {"id": second.admin_zone_id, "name": second.admin_zone.name})
+        self.assertEqual(response.json()["missing"], [])
+        mock_geo.assert_called_once()
+
+    @mock.patch("grms.services.map_services.get_admin_area_viewport")
+    def test_bulk_map_context_lists_missing_ids(self, mock_geo):
+        mock_geo.return_value = {"center": {"lat": 13.5, "lng": 39.5}, "viewport": None, "bounds": None}
+        road, _, _ = self.create_network("BulkMissing")
+
+        url = reverse("road_map_context_bulk")
+        response = self.client.post(url, {"road_ids": [road.id, road.id + 1000]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()["results"]), {str(road.id)})
+        self.assertEqual(response.json()["missing"], [road.id + 1000])
+
+    def test_bulk_map_context_rejects_invalid_ids(self):
+        url = reverse("road_map_context_bulk")
+        for road_ids in ("1,2", [True], list(range(501))):
+            response = self.client.post(url, {"road_ids": road_ids}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, road_ids)
+
     def test_default_map_context_returns_zone_37n_region(self):
         url = reverse("road_map_context_default")
         response = self.client.get(url)
@@ -0,0 +1,76 @@
+"""Tests for the ``?stream=1`` list export."""
+
+from __future__ import annotations
+
+import json
+
+from rest_framework import filters, viewsets
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from grms import models, serializers
+from grms.views import StreamingListMixin
+
+
+class CategoryFilter(filters.BaseFilterBackend):
+    def filter_queryset(self, request, queryset, view):
+        category = request.query_params.get("category")
+        return queryset.filter(category=category) if category else queryset
+
+
+class DistressTypeExportViewSet(StreamingListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = models.DistressType.objects.order_by("distress_code")
+    serializer_class = serializers.DistressTypeSerializer
+    filter_backends = [CategoryFilter]
+    stream_chunk_size = 2
+
+
+class StreamingListTests(APITestCase):
+    def setUp(self):
+        self.view = DistressTypeExportViewSet.as_view({"get": "list"})
+        self.factory = APIRequestFactory()
+
+    def _create_rows(self):
+        for code, category in (("PH", "road"), ("RV", "road"), ("CR", "bridge")):
+            models.DistressType.objects.create(distress_code=code, distress_name=code, category=category)
+
+    def _get(self, **params):
+        response = self.view(self.factory.get("/export/", params))
+        if response.streaming:
+            return response, json.loads(b"".join(response.streaming_content))
+        response.render()
+        return response, json.loads(response.content)
+
+    def test_stream_matches_the_regular_list(self):
+        self._create_rows()
+
+        streamed, streamed_rows = self._get(stream="1")
+        regular, regular_rows = self._get()
+
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed["Content-Type"], "application/json")
+        self.assertFalse(regular.streaming)
+        self.assertEqual(streamed_rows, regular_rows)
+        self.assertEqual([row["distress_code"] for row in streamed_rows], ["CR", "PH", "RV"])
+
+    def test_stream_applies_filter_parameters(self):
+        self._create_rows()
+
+        _, streamed_rows = self._get(stream="1", category="road")
+        _, regular_rows = self._get(category="road")
+
+        self.assertEqual(streamed_rows, regular_rows)
+        self.assertEqual([row["distress_code"] for row in streamed_rows], ["PH", "RV"])
+
+    def test_stream_of_an_empty_queryset_is_an_empty_array(self):
+        response, rows = self._get(stream="1")
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(rows, [])
+
+    def test_other_stream_values_use_the_regular_list(self):
+        self._create_rows()
+
+        response, rows = self._get(stream="true")
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(rows), 3)
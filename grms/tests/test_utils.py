@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import io
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from grms.utils import (
+    _substring_coordinates,
+    fetch_osrm_route,
+    geometry_length_km,
+    point_at_chainage,
+    slice_geometry_by_chainage,
+    utm_to_wgs84,
+    utm_to_wgs84_many,
+)
+
+
+def _line(*coords):
+    return {"type": "LineString", "coordinates": [list(c) for c in coords], "srid": 4326}
+
+
+class SliceGeometryByChainageTests(SimpleTestCase):
+    def setUp(self):
+        self.line = _line((39.0, 13.0), (39.01, 13.0), (39.02, 13.01), (39.03, 13.02))
+        self.total_km = geometry_length_km(self.line)
+
+    def test_full_range_returns_all_vertices(self):
+        sliced = slice_geometry_by_chainage(self.line, 0, self.total_km + 5)
+        self.assertEqual(sliced["coordinates"], [tuple(c) for c in self.line["coordinates"]])
+
+    def test_interior_vertices_are_kept_between_interpolated_ends(self):
+        sliced = slice_geometry_by_chainage(self.line, 0.5, 2.5)
+        coords = sliced["coordinates"]
+        self.assertEqual(len(coords), 3)
+        self.assertEqual(coords[1], (39.01, 13.0))
+        self.assertAlmostEqual(geometry_length_km(sliced), 2.0, places=3)
+
+    def test_slice_within_single_segment(self):
+        sliced = slice_geometry_by_chainage(self.line, 0.1, 0.2)
+        self.assertEqual(len(sliced["coordinates"]), 2)
+        self.assertAlmostEqual(geometry_length_km(sliced), 0.1, places=4)
+
+    def test_invalid_ranges_return_none(self):
+        self.assertIsNone(slice_geometry_by_chainage(self.line, -1, 1))
+        self.assertIsNone(slice_geometry_by_chainage(self.line, 2, 1))
+        self.assertIsNone(slice_geometry_by_chainage(self.line, self.total_km, self.total_km + 1))
+        self.assertIsNone(slice_geometry_by_chainage(_line((39.0, 13.0)), 0, 1))
+
+
+class PointAtChainageTests(SimpleTestCase):
+    def setUp(self):
+        self.line = _line((39.0, 13.0), (39.01, 13.0), (39.02, 13.01))
+        self.first_km = geometry_length_km(_line((39.0, 13.0), (39.01, 13.0)))
+
+    def test_interpolates_within_the_containing_segment(self):
+        lng, lat = point_at_chainage(self.line, self.first_km / 2)
+        self.assertAlmostEqual(lng, 39.005)
+        self.assertAlmostEqual(lat, 13.0)
+        self.assertEqual(point_at_chainage(self.line, self.first_km), (39.01, 13.0))
+
+    def test_clamps_past_the_end_and_rejects_degenerate_lines(self):
+        self.assertEqual(point_at_chainage(self.line, 1000), (39.02, 13.01))
+        self.assertIsNone(point_at_chainage(_line((39.0, 13.0)), 0))
+        self.assertIsNone(point_at_chainage(_line((39.0, 13.0), (39.0, 13.0)), 0))
+
+
+class SubstringCoordinatesTests(SimpleTestCase):
+    def test_planar_substring_interpolates_both_ends(self):
+        coords = [(0.0, 0.0), (100.0, 0.0), (100.0, 100.0)]
+        cumulative = [0.0, 100.0, 200.0]
+
+        self.assertEqual(
+            _substring_coordinates(coords, cumulative, 50.0, 150.0),
+            [(50.0, 0.0), (100.0, 0.0), (100.0, 50.0)],
+        )
+
+    def test_end_on_final_vertex_stays_on_last_segment(self):
+        coords = [(0.0, 0.0), (100.0, 0.0)]
+        cumulative = [0.0, 100.0]
+
+        self.assertEqual(
+            _substring_coordinates(coords, cumulative, 0.0, 100.0),
+            [(0.0, 0.0), (100.0, 0.0)],
+        )
+
+
+class UtmBatchConversionTests(SimpleTestCase):
+    def test_batch_matches_single_point_conversion(self):
+        eastings = [500000.0, 510000.5]
+        northings = [1500000.0, 1510000.0]
+
+        self.assertEqual(
+            utm_to_wgs84_many(eastings, northings, zone=37),
+            [utm_to_wgs84(e, n, zone=37) for e, n in zip(eastings, northings)],
+        )
+        self.assertEqual(utm_to_wgs84_many([], [], zone=37), [])
+
+
+class FetchOsrmRouteTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @staticmethod
+    def _response(payload):
+        return io.BytesIO(json.dumps(payload).encode())
+
+    def test_route_is_fetched_once_per_endpoint_pair(self):
+        payload = {"code": "Ok", "routes": [{"geometry": {"coordinates": [[39.0, 13.5], [39.1, 13.6]]}}]}
+        with mock.patch("grms.utils.urlopen", side_effect=lambda *a, **k: self._response(payload)) as urlopen:
+            first = fetch_osrm_route(39.0, 13.5, 39.1, 13.6)
+            second = fetch_osrm_route(39.0000001, 13.5, 39.1, 13.6)
+
+        self.assertEqual(first, [[39.0, 13.5], [39.1, 13.6]])
+        self.assertEqual(second, first)
+        self.assertEqual(urlopen.call_count, 1)
+
+    def test_failed_lookup_is_not_cached(self):
+        failure = {"code": "NoRoute", "message": "No route found"}
+        success = {"code": "Ok", "routes": [{"geometry": {"coordinates": [[39.0, 13.5], [39.1, 13.6]]}}]}
+        responses = iter([self._response(failure), self._response(success)])
+        with mock.patch("grms.utils.urlopen", side_effect=lambda *a, **k: next(responses)) as urlopen:
+            with self.assertRaisesMessage(ValueError, "No route found"):
+                fetch_osrm_route(39.0, 13.5, 39.1, 13.6)
+            route = fetch_osrm_route(39.0, 13.5, 39.1, 13.6)
+
+        self.assertEqual(route, [[39.0, 13.5], [39.1, 13.6]])
+        self.assertEqual(urlopen.call_count, 2)
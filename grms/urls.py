@@ -106,6 +106,7 @@ urlpatterns = [
     path("api/auth/login/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("api/roads/map-context/", views.road_map_context_default, name="road_map_context_default"),
+    path("api/roads/map-context/bulk/", views.road_map_context_bulk, name="road_map_context_bulk"),
     path("api/routes/preview/", views.preview_route, name="route_preview"),
     path("api/roads/<int:pk>/geometry/", views.update_road_geometry, name="road_geometry"),
     path("api/roads/<int:pk>/route/", views.update_road_route, name="road_route"),
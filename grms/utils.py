@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import math
+from bisect import bisect_left, bisect_right
 from decimal import Decimal
+from functools import lru_cache
 from math import sqrt
 from typing import Dict, Iterable, Optional, Sequence, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.request import urlopen
 
+from django.core.cache import cache
 from django.db import connection
 
 try:  # pragma: no cover - optional dependency for conversion
@@ -17,6 +20,28 @@ try:  # pragma: no cover - optional dependency for conversion
 except ImportError:  # pragma: no cover - handled at runtime for clarity
     Transformer = None
 
+try:  # pragma: no cover - optional faster JSON parser for OSRM payloads
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used instead
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Northern-hemisphere UTM CRS identifiers for the zones covering Ethiopia and
+# its neighbours, built once instead of on every conversion.
+_UTM_CRS = {zone: f"EPSG:326{zone}" for zone in range(32, 40)}
+
+
+def _utm_crs(zone: int) -> str:
+    return _UTM_CRS.get(zone) or f"EPSG:326{zone}"
+
+
+@lru_cache(maxsize=32)
+def _get_transformer(source_crs: str, target_crs: str):
+    """Return a cached pyproj transformer; building the PROJ pipeline is the costly part."""
+
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
 
 def utm_to_wgs84(easting: float, northing: float, zone: int = 37) -> tuple[float, float]:
     """Convert UTM coordinates to WGS84 latitude/longitude.
@@ -27,11 +52,30 @@ def utm_to_wgs84(easting: float, northing: float, zone: int = 37) -> tuple[float
     if Transformer is None:
         raise ImportError("pyproj is required for UTM to WGS84 conversion. Install pyproj to continue.")
 
-    transformer = Transformer.from_crs(f"EPSG:326{zone}", "EPSG:4326", always_xy=True)
+    transformer = _get_transformer(_utm_crs(zone), "EPSG:4326")
     lon, lat = transformer.transform(easting, northing)
     return lat, lon
 
 
+def utm_to_wgs84_many(
+    eastings: Sequence[float], northings: Sequence[float], zone: int = 37
+) -> list[tuple[float, float]]:
+    """Convert parallel easting/northing sequences to ``(lat, lon)`` pairs.
+
+    One PROJ call handles the whole batch, which is several times cheaper
+    than calling :func:`utm_to_wgs84` per point.
+    """
+
+    if Transformer is None:
+        raise ImportError("pyproj is required for UTM to WGS84 conversion. Install pyproj to continue.")
+    if not eastings:
+        return []
+
+    transformer = _get_transformer(_utm_crs(zone), "EPSG:4326")
+    lons, lats = transformer.transform(list(eastings), list(northings))
+    return list(zip(lats, lons))
+
+
 def wgs84_to_utm(lat: float, lon: float, zone: int = 37) -> tuple[float, float]:
     """Convert WGS84 latitude/longitude to UTM coordinates.
 
@@ -41,7 +85,7 @@ def wgs84_to_utm(lat: float, lon: float, zone: int = 37) -> tuple[float, float]:
     if Transformer is None:
         raise ImportError("pyproj is required for WGS84 to UTM conversion. Install pyproj to continue.")
 
-    transformer = Transformer.from_crs("EPSG:4326", f"EPSG:326{zone}", always_xy=True)
+    transformer = _get_transformer("EPSG:4326", _utm_crs(zone))
     easting, northing = transformer.transform(lon, lat)
     return easting, northing
 
@@ -67,6 +111,11 @@ except Exception:  # pragma: no cover - runtime fallback when GIS libs are missi
 # Mean Earth radius according to IUGG (km)
 EARTH_RADIUS_KM = 6371.0088
 
+# Below this haversine term (segments shorter than ~1.27 km) asin(sqrt(a)) is
+# replaced by sqrt(a); the relative error is under a / 6, i.e. a few
+# micrometres on a kilometre-long segment.
+_HAVERSINE_LINEAR_LIMIT = 1e-8
+
 
 def _haversine_km(start: Sequence[float], end: Sequence[float]) -> float:
     """Return the haversine distance between two ``(lng, lat)`` points in km."""
@@ -79,18 +128,19 @@ def _haversine_km(start: Sequence[float], end: Sequence[float]) -> float:
     dlat = lat2_rad - lat1_rad
 
     a = math.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
+    root = math.sqrt(a)
+    c = 2 * (root if a < _HAVERSINE_LINEAR_LIMIT else math.asin(root))
     return EARTH_RADIUS_KM * c
 
 
-def _extract_coordinates(geometry) -> list[Tuple[float, float]]:
-    """Return a list of ``(lng, lat)`` pairs from a GEOS or GeoJSON geometry."""
+def _raw_coordinates(geometry) -> Sequence[Sequence[float]]:
+    """Return the unconverted vertex sequence of a GEOS or GeoJSON linestring."""
 
     if geometry is None:
-        return []
+        return ()
 
     if hasattr(geometry, "coords"):
-        return [(float(x), float(y)) for x, y in geometry.coords]
+        return geometry.coords
 
     if isinstance(geometry, dict):
         coords = geometry.get("coordinates") or []
@@ -98,21 +148,86 @@ def _extract_coordinates(geometry) -> list[Tuple[float, float]]:
             # GeoJSON LineString structure (may be nested one level deep)
             if isinstance(coords[0][0], (list, tuple)):
                 coords = coords[0]
-            return [(float(x), float(y)) for x, y in coords]
-    return []
+            return coords
+    return ()
+
+
+def _extract_coordinates(geometry) -> list[Tuple[float, float]]:
+    """Return a list of ``(lng, lat)`` pairs from a GEOS or GeoJSON geometry."""
+
+    return [(float(x), float(y)) for x, y in _raw_coordinates(geometry)]
+
+
+def _coordinates_with_cumulative_km(raw_coordinates) -> Tuple[list[Tuple[float, float]], list[float]]:
+    """Convert vertices to floats and accumulate haversine distances in one pass.
+
+    The haversine formula is inlined so each vertex's radians and cos(lat) are
+    computed once, rather than twice through :func:`_haversine_km` for the two
+    segments it bounds. Math functions and constants are bound to locals because this
+    loop runs once per vertex of every road geometry.
+    """
+
+    sin, cos, sqrt_, asin, radians = math.sin, math.cos, math.sqrt, math.asin, math.radians
+    diameter_km = 2 * EARTH_RADIUS_KM
+    linear_limit = _HAVERSINE_LINEAR_LIMIT
+
+    coordinates: list[Tuple[float, float]] = []
+    cumulative: list[float] = []
+    append_coordinate = coordinates.append
+    append_cumulative = cumulative.append
+    total = 0.0
+    previous_lon = previous_lat = previous_cos_lat = None
+    for x, y in raw_coordinates:
+        point = (float(x), float(y))
+        lon = radians(point[0])
+        lat = radians(point[1])
+        cos_lat = cos(lat)
+        if previous_lat is not None:
+            a = (
+                sin((lat - previous_lat) * 0.5) ** 2
+                + previous_cos_lat * cos_lat * sin((lon - previous_lon) * 0.5) ** 2
+            )
+            root = sqrt_(a)
+            total += diameter_km * (root if a < linear_limit else asin(root))
+        append_coordinate(point)
+        append_cumulative(total)
+        previous_lon, previous_lat, previous_cos_lat = lon, lat, cos_lat
+    return coordinates, cumulative
+
+
+_CHAINAGE_TABLE_ATTR = "_grms_chainage_table"
+
+
+def _chainage_table(geometry) -> Tuple[list[Tuple[float, float]], list[float]]:
+    """Return ``(coordinates, cumulative_km)`` for a linestring geometry.
+
+    The table is cached on GEOS instances so repeated slices of the same road
+    only pay for the haversine walk once. The cache is keyed on the raw vertex
+    tuple, so an in-place edit of the geometry invalidates it. GeoJSON-like
+    dictionaries are never annotated because they end up in API payloads.
+    """
+
+    raw_coordinates = _raw_coordinates(geometry)
+    cached = getattr(geometry, _CHAINAGE_TABLE_ATTR, None)
+    if cached is not None and cached[0] == raw_coordinates:
+        return cached[1]
+
+    table = _coordinates_with_cumulative_km(raw_coordinates)
+    if geometry is not None and not isinstance(geometry, dict):
+        try:
+            setattr(geometry, _CHAINAGE_TABLE_ATTR, (raw_coordinates, table))
+        except AttributeError:  # pragma: no cover - slotted or immutable geometry objects
+            pass
+    return table
 
 
 def geometry_length_km(geometry) -> float:
     """Calculate the total length of a linestring geometry in kilometres."""
 
-    coordinates = _extract_coordinates(geometry)
+    coordinates, cumulative = _chainage_table(geometry)
     if len(coordinates) < 2:
         return 0.0
-
-    total = 0.0
-    for start, end in zip(coordinates[:-1], coordinates[1:]):
-        total += _haversine_km(start, end)
-    return total
+    return cumulative[-1]
 
 
 def geos_length_km(geometry: GEOSGeometry | None) -> float:
@@ -124,16 +239,30 @@ def geos_length_km(geometry: GEOSGeometry | None) -> float:
     if isinstance(geometry, (list, tuple, dict)):
         return geometry_length_km(geometry)
 
+    geom_3857 = _metric_clone(geometry)
+    if geom_3857 is None:
+        return 0.0
+    try:
+        return float(geom_3857.length) / 1000
+    except Exception:
+        return 0.0
+
+
+def _metric_clone(geometry):
+    """Return an EPSG:3857 copy of a GEOS geometry, or ``None`` if it cannot be built."""
+
+    if geometry is None or isinstance(geometry, (list, tuple, dict)):
+        return None
+
     empty_flag = getattr(geometry, "empty", None)
     if empty_flag is True:
-        return 0.0
+        return None
 
     try:
-        geom_3857 = geometry.transform(3857, clone=True)
-        return float(geom_3857.length) / 1000
+        return geometry.transform(3857, clone=True)
     except Exception:
         # When a fallback JSON geometry or stub is provided, fail gracefully
-        return 0.0
+        return None
 
 
 def _interpolate_coordinate(start: Tuple[float, float], end: Tuple[float, float], fraction: float) -> Tuple[float, float]:
@@ -143,6 +272,35 @@ def _interpolate_coordinate(start: Tuple[float, float], end: Tuple[float, float]
     )
 
 
+def _interpolate_at(
+    coords: Sequence[Tuple[float, float]], cumulative: Sequence[float], index: int, target: float
+) -> Tuple[float, float]:
+    segment_length = cumulative[index + 1] - cumulative[index]
+    fraction = (target - cumulative[index]) / segment_length if segment_length else 0.0
+    return _interpolate_coordinate(coords[index], coords[index + 1], fraction)
+
+
+def _substring_coordinates(
+    coords: Sequence[Tuple[float, float]], cumulative: Sequence[float], start: float, end: float
+) -> list[Tuple[float, float]]:
+    """Return the vertices of ``coords`` between two distances along the line.
+
+    ``cumulative`` holds the running distance at each vertex in the same unit
+    as ``start``/``end`` (km on the sphere, metres in EPSG:3857). The segments
+    holding each end are found by binary search, so only those two points are
+    interpolated and the vertices in between are copied as-is.
+    """
+
+    last_segment = len(coords) - 2
+    start_index = min(bisect_right(cumulative, start) - 1, last_segment)
+    end_index = min(max(bisect_left(cumulative, end) - 1, start_index), last_segment)
+
+    sliced = [_interpolate_at(coords, cumulative, start_index, start)]
+    sliced.extend(coords[start_index + 1 : end_index + 1])
+    sliced.append(_interpolate_at(coords, cumulative, end_index, end))
+    return sliced
+
+
 def _build_linestring(coordinates: Iterable[Tuple[float, float]], *, srid: int | None, as_geos: bool):
     coords_list = list(coordinates)
     if as_geos:
@@ -165,11 +323,11 @@ def slice_geometry_by_chainage(geometry, start_chainage_km: float, end_chainage_
     if start_chainage_km < 0 or end_chainage_km <= start_chainage_km:
         return None
 
-    coords = _extract_coordinates(geometry)
+    coords, cumulative_km = _chainage_table(geometry)
     if len(coords) < 2:
         return None
 
-    total_length = geometry_length_km(geometry)
+    total_length = cumulative_km[-1]
     if total_length == 0:
         return None
 
@@ -178,37 +336,33 @@ def slice_geometry_by_chainage(geometry, start_chainage_km: float, end_chainage_
     if start_km >= total_length:
         return None
 
-    sliced_coords: list[Tuple[float, float]] = []
-    cumulative = 0.0
+    sliced_coords = _substring_coordinates(coords, cumulative_km, start_km, end_km)
     srid = getattr(geometry, "srid", None)
     as_geos = getattr(settings, "USE_POSTGIS", False) and hasattr(geometry, "coords")
+    return _build_linestring(sliced_coords, srid=srid, as_geos=as_geos)
 
-    for start, end in zip(coords[:-1], coords[1:]):
-        segment_length = _haversine_km(start, end)
-        next_cumulative = cumulative + segment_length
-
-        if start_km >= cumulative and start_km <= next_cumulative:
-            fraction = (start_km - cumulative) / segment_length if segment_length else 0.0
-            sliced_start = _interpolate_coordinate(start, end, fraction)
-            sliced_coords.append(sliced_start)
 
-        if end_km >= cumulative and end_km <= next_cumulative:
-            fraction = (end_km - cumulative) / segment_length if segment_length else 0.0
-            sliced_end = _interpolate_coordinate(start, end, fraction)
-            if not sliced_coords:
-                sliced_coords.append(_interpolate_coordinate(start, end, 0))
-            sliced_coords.append(sliced_end)
-            break
+def point_at_chainage(geometry, chainage_km: float) -> Optional[Tuple[float, float]]:
+    """Return the ``(lng, lat)`` vertex interpolated at ``chainage_km``.
 
-        if sliced_coords and end_km > next_cumulative:
-            sliced_coords.append(end)
+    Chainages past the end of the line clamp to its last vertex. The segment
+    is found by bisecting the cached cumulative-distance table instead of
+    re-walking the line.
+    """
 
-        cumulative = next_cumulative
+    coords, cumulative_km = _chainage_table(geometry)
+    if len(coords) < 2:
+        return None
 
-    if len(sliced_coords) < 2:
+    total_length = cumulative_km[-1]
+    if total_length <= 0:
         return None
 
-    return _build_linestring(sliced_coords, srid=srid, as_geos=as_geos)
+    target_km = min(float(chainage_km), total_length)
+    index = bisect_left(cumulative_km, target_km, 1)
+    if index >= len(coords):
+        return coords[-1]
+    return _interpolate_at(coords, cumulative_km, index - 1, target_km)
 
 
 def line_distance(p1, p2):
@@ -253,11 +407,12 @@ def _postgis_line_substring(geom, start_frac: float, end_frac: float):
     }
 
 
-def _slice_linestring_vertices(geom, start_km: float, end_km: float, *, total_km: float):
+def _slice_linestring_vertices(geom, start_km: float, end_km: float, *, total_km: float, geom_metric=None):
     if not GEOS_AVAILABLE:
         return None
 
-    geom_metric = geom.transform(3857, clone=True)
+    if geom_metric is None:
+        geom_metric = geom.transform(3857, clone=True)
     coords = list(geom_metric.coords)
     if len(coords) < 2:
         return None
@@ -268,31 +423,10 @@ def _slice_linestring_vertices(geom, start_km: float, end_km: float, *, total_km
     start_m = min(start_m, total_m)
     end_m = min(end_m, total_m)
 
-    sliced_coords: list[tuple[float, float]] = []
-    cumulative = 0.0
-
+    cumulative = [0.0]
     for start, end in zip(coords[:-1], coords[1:]):
-        segment_length = line_distance(start, end)
-        next_cumulative = cumulative + segment_length
-
-        if start_m >= cumulative and start_m <= next_cumulative:
-            fraction = (start_m - cumulative) / segment_length if segment_length else 0.0
-            sliced_coords.append(_interpolate_coordinate(start, end, fraction))
-
-        if end_m >= cumulative and end_m <= next_cumulative:
-            fraction = (end_m - cumulative) / segment_length if segment_length else 0.0
-            if not sliced_coords:
-                sliced_coords.append(start)
-            sliced_coords.append(_interpolate_coordinate(start, end, fraction))
-            break
-
-        if sliced_coords and end_m > next_cumulative:
-            sliced_coords.append(end)
-
-        cumulative = next_cumulative
-
-    if len(sliced_coords) < 2:
-        return None
+        cumulative.append(cumulative[-1] + line_distance(start, end))
+    sliced_coords = _substring_coordinates(coords, cumulative, start_m, end_m)
 
     line_3857 = _build_linestring(sliced_coords, srid=3857, as_geos=True)
     line_4326 = line_3857.transform(geom.srid or 4326, clone=True)
@@ -309,16 +443,23 @@ def _slice_linestring_vertices(geom, start_km: float, end_km: float, *, total_km
     }
 
 
-def slice_linestring_by_chainage(geom, start_km: float, end_km: float):
-    """Slice a LineString between chainages using PostGIS with Python fallback."""
+def _metric_length(geom):
+    """Return ``(geom_metric, total_km)`` for a line about to be sliced by chainage."""
 
-    if geom is None:
-        return None
+    # Project once: the metric copy gives the length and is reused by the
+    # vertex-walking fallback.
+    geom_metric = _metric_clone(geom)
+    if geom_metric is not None:
+        try:
+            total_km = float(geom_metric.length) / 1000
+        except Exception:
+            total_km = 0.0
+    else:
+        total_km = geos_length_km(geom)
+    return geom_metric, total_km
 
-    total_km = geos_length_km(geom)
-    if total_km <= 0:
-        return None
 
+def _chainage_fractions(start_km: float, end_km: float, total_km: float) -> Optional[Tuple[float, float]]:
     start_frac = float(Decimal(str(start_km)) / Decimal(str(total_km)))
     end_frac = float(Decimal(str(end_km)) / Decimal(str(total_km)))
 
@@ -330,14 +471,10 @@ def slice_linestring_by_chainage(geom, start_km: float, end_km: float):
 
     if end_frac >= 0.999999:
         end_frac = 1.0
+    return start_frac, end_frac
 
-    result = _postgis_line_substring(geom, start_frac, end_frac)
-    if not result:
-        result = _slice_linestring_vertices(geom, start_km, end_km, total_km=total_km)
-
-    if not result:
-        return None
 
+def _slice_payload(geom, result, start_frac: float, end_frac: float, start_km: float, end_km: float):
     start_point_geom = result.get("start_point") or geom.interpolate(start_frac, normalized=True)
     end_point_geom = result.get("end_point") or geom.interpolate(end_frac, normalized=True)
 
@@ -349,6 +486,105 @@ def slice_linestring_by_chainage(geom, start_km: float, end_km: float):
     }
 
 
+def slice_linestring_by_chainage(geom, start_km: float, end_km: float):
+    """Slice a LineString between chainages using PostGIS with Python fallback."""
+
+    if geom is None:
+        return None
+
+    geom_metric, total_km = _metric_length(geom)
+    if total_km <= 0:
+        return None
+
+    fractions = _chainage_fractions(start_km, end_km, total_km)
+    if fractions is None:
+        return None
+    start_frac, end_frac = fractions
+
+    result = _postgis_line_substring(geom, start_frac, end_frac)
+    if not result:
+        result = _slice_linestring_vertices(geom, start_km, end_km, total_km=total_km, geom_metric=geom_metric)
+
+    if not result:
+        return None
+    return _slice_payload(geom, result, start_frac, end_frac, start_km, end_km)
+
+
+def _postgis_line_substrings(geom, fractions: Sequence[Tuple[float, float]]) -> list:
+    """Run :func:`_postgis_line_substring` for many fraction pairs in one query."""
+
+    if not GEOS_AVAILABLE or not fractions:
+        return [None] * len(fractions)
+
+    ewkb = geom.ewkb
+    sql = """
+        SELECT
+            ST_AsBinary(ST_LineSubstring(g.geom, r.start_frac, r.end_frac)),
+            ST_AsBinary(ST_LineInterpolatePoint(g.geom, r.start_frac)),
+            ST_AsBinary(ST_LineInterpolatePoint(g.geom, r.end_frac)),
+            ST_Length(g.geom::geography) / 1000.0
+        FROM (SELECT ST_GeomFromEWKB(%s) AS geom) AS g,
+            unnest(%s::float8[], %s::float8[]) WITH ORDINALITY AS r(start_frac, end_frac, ordinal)
+        ORDER BY r.ordinal
+    """
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql,
+                [ewkb, [start for start, _ in fractions], [end for _, end in fractions]],
+            )
+            rows = cursor.fetchall()
+    except Exception:
+        return [None] * len(fractions)
+
+    results = []
+    for geometry_wkb, start_wkb, end_wkb, length_km in rows:
+        if not geometry_wkb:
+            results.append(None)
+            continue
+        results.append(
+            {
+                "geometry": GEOSGeometry(memoryview(geometry_wkb)),
+                "start_point": GEOSGeometry(memoryview(start_wkb)) if start_wkb else None,
+                "end_point": GEOSGeometry(memoryview(end_wkb)) if end_wkb else None,
+                "length_km": float(length_km) if length_km is not None else None,
+            }
+        )
+    return results
+
+
+def slice_linestring_by_chainages(geom, ranges: Sequence[Tuple[float, float]]) -> list:
+    """Return :func:`slice_linestring_by_chainage` for each ``(start_km, end_km)``.
+
+    The line is projected and measured once, and all PostGIS substrings come
+    back from a single query instead of one round trip per range.
+    """
+
+    if geom is None or not ranges:
+        return [None] * len(ranges)
+
+    geom_metric, total_km = _metric_length(geom)
+    if total_km <= 0:
+        return [None] * len(ranges)
+
+    fractions = [_chainage_fractions(start_km, end_km, total_km) for start_km, end_km in ranges]
+    valid = [index for index, pair in enumerate(fractions) if pair is not None]
+    substrings = dict(zip(valid, _postgis_line_substrings(geom, [fractions[index] for index in valid])))
+
+    sliced = []
+    for index, (start_km, end_km) in enumerate(ranges):
+        if fractions[index] is None:
+            sliced.append(None)
+            continue
+        start_frac, end_frac = fractions[index]
+        result = substrings.get(index)
+        if not result:
+            result = _slice_linestring_vertices(geom, start_km, end_km, total_km=total_km, geom_metric=geom_metric)
+        sliced.append(_slice_payload(geom, result, start_frac, end_frac, start_km, end_km) if result else None)
+    return sliced
+
+
 def make_point(lat: float, lng: float):
     """Return a geometry instance that works with and without PostGIS."""
 
@@ -364,34 +600,53 @@ def point_to_lat_lng(point) -> Optional[Dict[str, float]]:
 
     if not point:
         return None
-    try:
-        lng = float(point.x)
-        lat = float(point.y)
-    except AttributeError:
-        coords = None
-        if isinstance(point, dict):
-            coords = point.get("coordinates")
+    if isinstance(point, dict):
+        coords = point.get("coordinates")
         if not coords or len(coords) < 2:
             return None
-        lng, lat = float(coords[0]), float(coords[1])
-    return {"lat": lat, "lng": lng}
+        return {"lat": float(coords[1]), "lng": float(coords[0])}
+    if hasattr(point, "x"):
+        return {"lat": float(point.y), "lng": float(point.x)}
+    return None
+
+
+OSRM_TIMEOUT_SECONDS = 10
+# Matches map_services.DIRECTIONS_CACHE_SECONDS; failures are never cached.
+OSRM_ROUTE_CACHE_SECONDS = 60 * 60
 
 
 def fetch_osrm_route(start_lng: float, start_lat: float, end_lng: float, end_lat: float) -> list[list[float]]:
-    """Fetch the decoded OSRM route geometry between two coordinates."""
+    """Fetch the decoded OSRM route geometry between two coordinates.
+
+    Routes are cached for an hour on endpoints rounded to six decimals (about
+    0.1 m), so ``Road.clean`` and ``Road.save`` for the same edit share one
+    request. Errors propagate and are retried on the next call.
+    """
+
+    endpoints = tuple(round(float(value), 6) for value in (start_lng, start_lat, end_lng, end_lat))
+    cache_key = "grms:osrm-route:{},{};{},{}".format(*endpoints)
+    route = cache.get(cache_key)
+    if route is None:
+        route = _fetch_osrm_route(*endpoints)
+        cache.set(cache_key, route, OSRM_ROUTE_CACHE_SECONDS)
+    return [[lon, lat] for lon, lat in route]
 
+
+def _fetch_osrm_route(
+    start_lng: float, start_lat: float, end_lng: float, end_lat: float
+) -> tuple[tuple[float, float], ...]:
     url = (
         "https://router.project-osrm.org/route/v1/driving/"
         f"{start_lng},{start_lat};{end_lng},{end_lat}?overview=full&geometries=geojson"
     )
 
     try:
-        with urlopen(url) as response:
+        with urlopen(url, timeout=OSRM_TIMEOUT_SECONDS) as response:
             data = response.read()
     except (HTTPError, URLError):  # pragma: no cover - network failures
         raise
 
-    payload = json.loads(data)
+    payload = _json_loads(data)
     if payload.get("code") != "Ok":
         raise ValueError(payload.get("message", "OSRM routing failed"))
 
@@ -403,16 +658,15 @@ def fetch_osrm_route(start_lng: float, start_lat: float, end_lng: float, end_lat
     if not coordinates:
         raise ValueError("OSRM route geometry is missing from the response")
 
-    return [[float(lon), float(lat)] for lon, lat in coordinates]
+    return tuple((float(lon), float(lat)) for lon, lat in coordinates)
 
 
 def osrm_linestring_to_geos(coords: Sequence[Sequence[float]]) -> GEOSGeometry:
     """Convert decoded OSRM coordinates to a GEOS LineString with SRID 4326."""
 
-    cleaned = [(float(lon), float(lat)) for lon, lat in coords]
-    if len(cleaned) < 2:
+    if len(coords) < 2:
         raise ValueError("At least two coordinates are required to build a LineString")
 
-    geom = LineString(cleaned)
-    geom.srid = 4326
-    return geom
+    # fetch_osrm_route already yields float pairs; GEOS reads the sequence
+    # directly so there is no need for an intermediate list of tuples.
+    return LineString(coords, srid=4326)
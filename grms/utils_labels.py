@@ -5,6 +5,9 @@ def fmt_km(x):
     if x is None:
         return "?"
     try:
+        # Model chainages are already Decimals; skip the str() round trip.
+        if isinstance(x, Decimal):
+            return f"{x:.3f}"
         return f"{Decimal(str(x)):.3f}"
     except Exception:
         return str(x)
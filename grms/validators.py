@@ -17,8 +17,16 @@ def validate_segment_belongs_to_section(section, segment, *, field: str = "road_
         )
 
 
-def validate_segment_belongs_to_road(road, segment, *, field: str = "road_segment") -> None:
-    if road and segment and segment.section.road_id != road.id:
+def validate_segment_belongs_to_road(
+    road, segment, *, field: str = "road_segment", section_road_id: int | None = None
+) -> None:
+    """Pass ``section_road_id`` when the segment's section is already loaded to skip a query."""
+
+    if not (road and segment):
+        return
+    if section_road_id is None:
+        section_road_id = segment.section.road_id
+    if section_road_id != road.id:
         raise ValidationError(
             {field: "Selected segment does not belong to the selected road."}
         )
@@ -38,8 +46,16 @@ def validate_structure_belongs_to_section(section, structure, *, field: str = "s
         )
 
 
-def validate_furniture_belongs_to_road(road, furniture, *, field: str = "furniture") -> None:
-    if road and furniture and furniture.section.road_id != road.id:
+def validate_furniture_belongs_to_road(
+    road, furniture, *, field: str = "furniture", section_road_id: int | None = None
+) -> None:
+    """Pass ``section_road_id`` when the furniture's section is already loaded to skip a query."""
+
+    if not (road and furniture):
+        return
+    if section_road_id is None:
+        section_road_id = furniture.section.road_id
+    if section_road_id != road.id:
         raise ValidationError(
             {field: "Selected furniture does not belong to the selected road."}
         )
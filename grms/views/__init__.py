@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from typing import Dict, List, Optional
 
 from django.contrib import admin
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
 
 try:
     from django.contrib.gis.geos import LineString
@@ -18,11 +20,14 @@ except Exception:  # pragma: no cover - runtime fallback when GIS libs are missi
 from django.urls import reverse
 
 from django.db import transaction
-from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.db.models import Max, Min, OuterRef, Prefetch, QuerySet, Subquery
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_http_methods
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -30,8 +35,16 @@ from traffic import models as traffic_models
 from grms import models, serializers
 from grms.forms import RoadAlignmentForm, RoadBasicForm, RoadSectionBasicForm
 from grms.services import map_services
+from grms.signals import (
+    LOOKUP_LIST_CACHE_SECONDS,
+    bump_map_geojson_version,
+    lookup_list_cache_key,
+    response_cache_enabled,
+)
 from grms.utils import GEOS_AVAILABLE, make_point, point_to_lat_lng, utm_to_wgs84
 
+_SORTED_TRAVEL_MODES = tuple(sorted(map_services.TRAVEL_MODES))
+
 
 @staff_member_required
 def dashboard_view(request):
@@ -42,8 +55,81 @@ def dashboard_view(request):
     return response
 
 
+class StreamingListMixin:
+    """Stream the unpaginated list as a JSON array when ``?stream=1`` is given.
+
+    Rows are read with a server-side cursor and serialised one at a time, so
+    large exports do not build the whole result list in memory.
+    """
+
+    stream_chunk_size = 2000
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("stream") != "1":
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        renderer = JSONRenderer()
+
+        def rows():
+            yield b"["
+            for index, obj in enumerate(queryset.iterator(chunk_size=self.stream_chunk_size)):
+                if index:
+                    yield b","
+                yield renderer.render(serializer_class(obj, context=context).data)
+            yield b"]"
+
+        return StreamingHttpResponse(rows(), content_type="application/json")
+
+
+class CachedLookupListMixin:
+    """Serve the unfiltered list from the cache with an ``ETag``.
+
+    With a shared cache (``settings.SHARED_CACHE``) the serialised rows are
+    kept until a row of the model is saved or deleted (see
+    :mod:`grms.signals`); otherwise they are rebuilt per request and only the
+    tag check applies. Clients that send the current tag back
+    in ``If-None-Match`` get an empty 304 response. The tag names the
+    negotiated renderer, so the JSON and browsable-API representations of the
+    same rows never validate each other.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        cache_key = lookup_list_cache_key(self.get_queryset().model) if response_cache_enabled() else None
+        cached = cache.get(cache_key) if cache_key else None
+        if cached is None:
+            data = super().list(request, *args, **kwargs).data
+            cached = (hashlib.md5(JSONRenderer().render(data)).hexdigest(), data)
+            if cache_key:
+                cache.set(cache_key, cached, LOOKUP_LIST_CACHE_SECONDS)
+
+        digest, data = cached
+        etag = f'"{digest}-{request.accepted_renderer.format}"'
+        if etag in request.headers.get("If-None-Match", ""):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response["ETag"] = etag
+        return response
+
+
+# Columns RoadSectionSerializer renders; section geometry and UTM inputs are
+# left out of read queries.
+_ROAD_SECTION_READ_FIELDS = [name for name in serializers.RoadSectionSerializer.Meta.fields if name != "segments"]
+
+
 class RoadViewSet(viewsets.ModelViewSet):
-    queryset: QuerySet[models.Road] = models.Road.objects.all()
+    queryset: QuerySet[models.Road] = models.Road.objects.prefetch_related(
+        Prefetch(
+            "sections",
+            queryset=models.RoadSection.objects.only(*_ROAD_SECTION_READ_FIELDS).prefetch_related("segments"),
+        )
+    )
     serializer_class = serializers.RoadSerializer
 
 
@@ -65,17 +151,24 @@ class AdminWoredaViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class RoadSectionViewSet(viewsets.ModelViewSet):
-    queryset = models.RoadSection.objects.select_related("road").all()
+    queryset = models.RoadSection.objects.prefetch_related("segments")
     serializer_class = serializers.RoadSectionSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Writes go through RoadSection.save(), which needs the full row.
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.only(*_ROAD_SECTION_READ_FIELDS)
+        return queryset
+
 
 class RoadSegmentViewSet(viewsets.ModelViewSet):
-    queryset = models.RoadSegment.objects.select_related("section", "section__road").all()
+    queryset = models.RoadSegment.objects.all()
     serializer_class = serializers.RoadSegmentSerializer
 
 
 class StructureInventoryViewSet(viewsets.ModelViewSet):
-    queryset = models.StructureInventory.objects.select_related("road", "section").all()
+    queryset = models.StructureInventory.objects.all()
     serializer_class = serializers.StructureInventorySerializer
 
     def perform_create(self, serializer):
@@ -86,98 +179,92 @@ class StructureInventoryViewSet(viewsets.ModelViewSet):
 
 
 class FurnitureInventoryViewSet(viewsets.ModelViewSet):
-    queryset = models.FurnitureInventory.objects.select_related("section", "section__road").all()
+    queryset = models.FurnitureInventory.objects.all()
     serializer_class = serializers.FurnitureInventorySerializer
 
 
 class RoadConditionSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.RoadConditionSurvey.objects.select_related("road_segment").order_by("-inspection_date")
+    queryset = models.RoadConditionSurvey.objects.order_by("-inspection_date")
     serializer_class = serializers.RoadConditionSurveySerializer
 
 
-class RoadConditionDetailedSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.RoadConditionDetailedSurvey.objects.select_related(
-        "road_segment", "road_segment__section", "distress", "activity"
-    ).order_by("-inspection_date")
+class RoadConditionDetailedSurveyViewSet(StreamingListMixin, viewsets.ModelViewSet):
+    queryset = models.RoadConditionDetailedSurvey.objects.order_by("-inspection_date")
     serializer_class = serializers.RoadConditionDetailedSurveySerializer
 
 
 class FurnitureConditionSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.FurnitureConditionSurvey.objects.select_related("furniture").order_by("-inspection_date")
+    queryset = models.FurnitureConditionSurvey.objects.order_by("-inspection_date")
     serializer_class = serializers.FurnitureConditionSurveySerializer
 
 
-class FurnitureConditionDetailedSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.FurnitureConditionDetailedSurvey.objects.select_related(
-        "furniture", "distress", "activity"
-    ).order_by("-inspection_date")
+class FurnitureConditionDetailedSurveyViewSet(StreamingListMixin, viewsets.ModelViewSet):
+    queryset = models.FurnitureConditionDetailedSurvey.objects.order_by("-inspection_date")
     serializer_class = serializers.FurnitureConditionDetailedSurveySerializer
 
 
 class StructureConditionSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.StructureConditionSurvey.objects.select_related("structure").order_by("-inspection_date")
+    queryset = models.StructureConditionSurvey.objects.order_by("-inspection_date")
     serializer_class = serializers.StructureConditionSurveySerializer
 
 
-class StructureConditionDetailedSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.StructureConditionDetailedSurvey.objects.select_related(
-        "structure", "structure__road", "distress", "activity"
-    ).order_by("-inspection_date")
+class StructureConditionDetailedSurveyViewSet(StreamingListMixin, viewsets.ModelViewSet):
+    queryset = models.StructureConditionDetailedSurvey.objects.order_by("-inspection_date")
     serializer_class = serializers.StructureConditionDetailedSurveySerializer
 
 
 class BridgeConditionSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.BridgeConditionSurvey.objects.select_related("structure_survey").all()
+    queryset = models.BridgeConditionSurvey.objects.all()
     serializer_class = serializers.BridgeConditionSurveySerializer
 
 
 class CulvertConditionSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.CulvertConditionSurvey.objects.select_related("structure_survey").all()
+    queryset = models.CulvertConditionSurvey.objects.all()
     serializer_class = serializers.CulvertConditionSurveySerializer
 
 
 class OtherStructureConditionSurveyViewSet(viewsets.ModelViewSet):
-    queryset = models.OtherStructureConditionSurvey.objects.select_related("structure_survey").all()
+    queryset = models.OtherStructureConditionSurvey.objects.all()
     serializer_class = serializers.OtherStructureConditionSurveySerializer
 
 
 class TrafficSurveyViewSet(viewsets.ModelViewSet):
-    queryset = traffic_models.TrafficSurvey.objects.select_related("road").all()
+    queryset = traffic_models.TrafficSurvey.objects.prefetch_related("count_records")
     serializer_class = serializers.TrafficSurveySerializer
 
 
-class TrafficCountRecordViewSet(viewsets.ModelViewSet):
-    queryset = traffic_models.TrafficCountRecord.objects.select_related("traffic_survey", "traffic_survey__road").all()
+class TrafficCountRecordViewSet(StreamingListMixin, viewsets.ModelViewSet):
+    queryset = traffic_models.TrafficCountRecord.objects.all()
     serializer_class = serializers.TrafficCountRecordSerializer
 
 
 class TrafficCycleSummaryViewSet(viewsets.ModelViewSet):
-    queryset = traffic_models.TrafficCycleSummary.objects.select_related("traffic_survey", "road").all()
+    queryset = traffic_models.TrafficCycleSummary.objects.all()
     serializer_class = serializers.TrafficCycleSummarySerializer
 
 
 class TrafficSurveySummaryViewSet(viewsets.ModelViewSet):
-    queryset = traffic_models.TrafficSurveySummary.objects.select_related("road").all()
+    queryset = traffic_models.TrafficSurveySummary.objects.all()
     serializer_class = serializers.TrafficSurveySummarySerializer
 
 
 class TrafficQCViewSet(viewsets.ModelViewSet):
-    queryset = traffic_models.TrafficQc.objects.select_related("traffic_survey", "road").all()
+    queryset = traffic_models.TrafficQc.objects.all()
     serializer_class = serializers.TrafficQCSerializer
 
 
 class TrafficForPrioritizationViewSet(viewsets.ModelViewSet):
-    queryset = traffic_models.TrafficForPrioritization.objects.select_related("road").all()
+    queryset = traffic_models.TrafficForPrioritization.objects.all()
     serializer_class = serializers.TrafficForPrioritizationSerializer
 
 
-class ActivityLookupViewSet(viewsets.ModelViewSet):
+class ActivityLookupViewSet(CachedLookupListMixin, viewsets.ModelViewSet):
     queryset = models.ActivityLookup.objects.all()
     serializer_class = serializers.ActivityLookupSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 
-class InterventionLookupViewSet(viewsets.ModelViewSet):
+class InterventionLookupViewSet(CachedLookupListMixin, viewsets.ModelViewSet):
     queryset = models.InterventionLookup.objects.all()
     serializer_class = serializers.InterventionLookupSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -203,7 +290,7 @@ class BenefitFactorViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.BenefitFactorSerializer
 
 
-class DistressTypeViewSet(viewsets.ModelViewSet):
+class DistressTypeViewSet(CachedLookupListMixin, viewsets.ModelViewSet):
     queryset = models.DistressType.objects.all()
     serializer_class = serializers.DistressTypeSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -221,9 +308,32 @@ class DistressActivityViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
 
+class PrioritizationResultPagination(PageNumberPagination):
+    """Page only when asked to with ``?page`` or ``?page_size``.
+
+    Plain list requests keep returning the bare JSON array that existing
+    clients consume.
+    """
+
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
 class PrioritizationResultViewSet(viewsets.ModelViewSet):
-    queryset = models.PrioritizationResult.objects.select_related("road", "section").order_by("priority_rank")
+    # The serializer reads the road's link type for every row; the section is
+    # only emitted as a primary key, so it does not need to be joined.
+    queryset = models.PrioritizationResult.objects.select_related("road__socioeconomic__road_link_type").order_by(
+        "priority_rank"
+    )
     serializer_class = serializers.PrioritizationResultSerializer
+    pagination_class = PrioritizationResultPagination
 
 
 class AnnualWorkPlanViewSet(viewsets.ModelViewSet):
@@ -240,7 +350,7 @@ def _map_region_for_road(road: models.Road) -> Dict[str, Any]:
 
     if zone or woreda:
         try:
-            map_region = map_services.get_admin_area_viewport(
+            map_region = map_services.get_cached_admin_area_viewport(
                 zone.name if zone else None, woreda.name if woreda else None
             )
         except map_services.MapServiceError:
@@ -275,16 +385,13 @@ def _latlng_from_utm(data: Dict[str, Any], prefix: str) -> Optional[Dict[str, fl
     """Convert UTM inputs into a lat/lng pair for map previews."""
 
     try:
-        easting = Decimal(data.get(f"{prefix}_easting"))
-        northing = Decimal(data.get(f"{prefix}_northing"))
-    except (TypeError, InvalidOperation):  # type: ignore[arg-type]
-        return None
-
-    if easting is None or northing is None:
+        easting = float(data.get(f"{prefix}_easting"))
+        northing = float(data.get(f"{prefix}_northing"))
+    except (TypeError, ValueError):
         return None
 
     try:
-        lat, lng = utm_to_wgs84(float(easting), float(northing), zone=37)
+        lat, lng = utm_to_wgs84(easting, northing, zone=37)
     except Exception:
         return None
 
@@ -520,9 +627,10 @@ def section_map_preview(request: Request, road_id: int, section_id: int):
 def update_road_route(request: Request, pk: int) -> Response:
     """Store or reuse road endpoints and retrieve the OpenStreetMap route."""
 
-    road = get_object_or_404(models.Road, pk=pk)
-
     if request.method == "POST":
+        # Road.save() reads the UTM, geometry and length columns, so load the
+        # full row when the endpoints are being stored.
+        road = get_object_or_404(models.Road, pk=pk)
         serializer = serializers.RoadRouteRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         start = serializer.validated_data["start"]
@@ -533,6 +641,9 @@ def update_road_route(request: Request, pk: int) -> Response:
         road.road_end_coordinates = make_point(end["lat"], end["lng"])
         road.save(update_fields=["road_start_coordinates", "road_end_coordinates"])
     else:
+        road = get_object_or_404(
+            models.Road.objects.only("id", "road_start_coordinates", "road_end_coordinates"), pk=pk
+        )
         start = point_to_lat_lng(road.road_start_coordinates)
         end = point_to_lat_lng(road.road_end_coordinates)
         if not start or not end:
@@ -552,16 +663,22 @@ def update_road_route(request: Request, pk: int) -> Response:
         start = serializer.validated_data["start"]
         end = serializer.validated_data["end"]
 
-    try:
-        route = map_services.get_directions(
-            start_lat=start["lat"],
-            start_lng=start["lng"],
-            end_lat=end["lat"],
-            end_lng=end["lng"],
-            travel_mode=travel_mode,
-        )
-    except map_services.MapServiceError as exc:
-        return Response({"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
+    cache_key = "grms:directions:{:.5f}:{:.5f}:{:.5f}:{:.5f}:{}".format(
+        start["lat"], start["lng"], end["lat"], end["lng"], travel_mode
+    )
+    route = cache.get(cache_key)
+    if route is None:
+        try:
+            route = map_services.get_directions(
+                start_lat=start["lat"],
+                start_lng=start["lng"],
+                end_lat=end["lat"],
+                end_lng=end["lng"],
+                travel_mode=travel_mode,
+            )
+        except map_services.MapServiceError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
+        cache.set(cache_key, route, map_services.DIRECTIONS_CACHE_SECONDS)
 
     return Response(
         {"road": road.id, "start": start, "end": end, "travel_mode": travel_mode, "route": route},
@@ -601,6 +718,7 @@ def update_road_geometry(request: Request, pk: int) -> Response:
         length_km = road.compute_length_km_from_geom().quantize(quantizer)
 
     models.Road.objects.filter(pk=road.pk).update(geometry=geometry, total_length_km=length_km)
+    bump_map_geojson_version()
 
     return Response({"ok": True, "length_km": float(length_km)}, status=status.HTTP_200_OK)
 
@@ -664,29 +782,47 @@ def save_road_geometry(request, pk):
     return Response({"status": "geometry_saved"})
 
 
-def _road_map_context_data(request: Request, pk: Optional[int] = None) -> dict:
-    def _geometry_to_json(geom):
-        if not geom:
+def _geometry_to_json(geom):
+    if not geom:
+        return None
+    if hasattr(geom, "geojson"):
+        try:
+            return json.loads(geom.geojson)
+        except Exception:
             return None
-        if hasattr(geom, "geojson"):
-            try:
-                import json
+    return geom
 
-                return json.loads(geom.geojson)
-            except Exception:
-                return None
-        return geom
 
+def _road_map_payload(road: Optional[models.Road], zone, woreda, map_region: Dict[str, Any]) -> dict:
+    road_payload: Optional[dict] = None
+    if road:
+        road_payload = {
+            "id": road.id,
+            "name_from": road.road_name_from,
+            "name_to": road.road_name_to,
+            "length_km": float(road.total_length_km) if road.total_length_km else None,
+            "start": point_to_lat_lng(road.road_start_coordinates),  # {"lat": ..., "lng": ...} or None
+            "end": point_to_lat_lng(road.road_end_coordinates),  # {"lat": ..., "lng": ...} or None
+            "geometry": _geometry_to_json(getattr(road, "geometry", None)),
+        }
+
+    return {
+        "road": road_payload,
+        "zone": {"id": zone.id, "name": zone.name} if zone else None,
+        "woreda": {"id": woreda.id, "name": woreda.name} if woreda else None,
+        "road_length_km": float(road.total_length_km) if road and road.total_length_km else None,
+        "map_region": map_region,
+        "travel_modes": _SORTED_TRAVEL_MODES,
+    }
+
+
+def _road_map_context_data(request: Request, pk: Optional[int] = None) -> dict:
     road: Optional[models.Road] = None
-    start = None
-    end = None
     zone: Optional[models.AdminZone] = None
     woreda: Optional[models.AdminWoreda] = None
 
     if pk is not None:
         road = get_object_or_404(models.Road.objects.select_related("admin_zone", "admin_woreda"), pk=pk)
-        start = point_to_lat_lng(road.road_start_coordinates)
-        end = point_to_lat_lng(road.road_end_coordinates)
         zone = road.admin_zone
         woreda = road.admin_woreda
 
@@ -714,26 +850,7 @@ def _road_map_context_data(request: Request, pk: Optional[int] = None) -> dict:
         zone.name if zone else None, woreda_for_lookup.name if woreda_for_lookup else None
     )
 
-    road_payload: Optional[dict] = None
-    if road:
-        road_payload = {
-            "id": road.id,
-            "name_from": road.road_name_from,
-            "name_to": road.road_name_to,
-            "length_km": float(road.total_length_km) if road.total_length_km else None,
-            "start": start,  # {"lat": ..., "lng": ...} or None
-            "end": end,      # {"lat": ..., "lng": ...} or None
-            "geometry": _geometry_to_json(getattr(road, "geometry", None)),
-        }
-
-    return {
-        "road": road_payload,
-        "zone": {"id": zone.id, "name": zone.name} if zone else None,
-        "woreda": {"id": woreda.id, "name": woreda.name} if woreda else None,
-        "road_length_km": float(road.total_length_km) if road and road.total_length_km else None,
-        "map_region": map_region,
-        "travel_modes": sorted(map_services.TRAVEL_MODES),
-    }
+    return _road_map_payload(road, zone, woreda, map_region)
 
 
 @api_view(["GET"])
@@ -761,6 +878,35 @@ def road_map_context_default(request: Request) -> Response:
     return Response(payload)
 
 
+@api_view(["POST"])
+def road_map_context_bulk(request: Request) -> Response:
+    """Return map contexts for several roads, keyed by road id.
+
+    Each entry matches the ``road_map_context`` payload for that road. Roads
+    sharing a zone/woreda reuse one viewport lookup. Requested ids with no
+    matching road are listed under ``missing`` rather than in ``results``.
+    """
+
+    serializer = serializers.RoadMapContextBulkSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    road_ids = serializer.validated_data["road_ids"]
+
+    regions: Dict[tuple, Dict[str, Any]] = {}
+    contexts: Dict[int, dict] = {}
+    for road in models.Road.objects.select_related("admin_zone", "admin_woreda").filter(pk__in=road_ids):
+        zone = road.admin_zone
+        woreda = road.admin_woreda
+        if woreda and zone and woreda.zone_id != zone.id:
+            woreda = None
+        key = (zone.name if zone else None, woreda.name if woreda else None)
+        if key not in regions:
+            regions[key] = map_services.get_admin_area_viewport_or_default(*key)
+        contexts[road.id] = _road_map_payload(road, zone, woreda, regions[key])
+
+    missing = sorted(set(road_ids) - contexts.keys())
+    return Response({"results": contexts, "missing": missing})
+
+
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
 def run_prioritization(request: Request) -> Response:
@@ -775,77 +921,104 @@ def run_prioritization(request: Request) -> Response:
     }
     fiscal_year = request.data.get("fiscal_year")
 
-    traffic_values = traffic_models.TrafficForPrioritization.objects.all()
+    traffic_values = traffic_models.TrafficForPrioritization.objects.filter(value_type="PCU")
     if fiscal_year:
         traffic_values = traffic_values.filter(fiscal_year=fiscal_year)
-    pcu_values = [float(item.value) for item in traffic_values.filter(value_type="PCU")]
-    pcu_min = min(pcu_values) if pcu_values else 0.0
-    pcu_max = max(pcu_values) if pcu_values else 0.0
+
+    latest_survey_subquery = (
+        models.RoadConditionSurvey.objects.filter(road_segment__section__road=OuterRef("pk"))
+        .order_by("-inspection_date")
+        .values("pk")[:1]
+    )
+    mci_subquery = (
+        models.SegmentMCIResult.objects.filter(survey=OuterRef("latest_survey_id")).order_by().values("mci_value")[:1]
+    )
+    pcu_subquery = traffic_values.filter(road=OuterRef("pk")).order_by("-fiscal_year").values("value")[:1]
+    # Match BenefitFactor's default "-fiscal_year" ordering that .first() used.
+    benefit_subquery = (
+        models.BenefitFactor.objects.filter(road=OuterRef("pk")).order_by("-fiscal_year").values("total_benefit_score")[:1]
+    )
+    # Every per-road input is resolved server-side in one query, returning
+    # plain value rows rather than Road instances.
+    road_rows = list(
+        models.Road.objects.annotate(latest_survey_id=Subquery(latest_survey_subquery))
+        .annotate(
+            mci_value=Subquery(mci_subquery),
+            pcu=Subquery(pcu_subquery),
+            benefit_score=Subquery(benefit_subquery),
+        )
+        .values_list("id", "socioeconomic__population_served", "latest_survey_id", "mci_value", "pcu", "benefit_score")
+    )
+    if not road_rows:
+        # Nothing to score; skip the remaining lookups and the transaction.
+        return Response([])
+
+    pcu_bounds = traffic_values.aggregate(pcu_min=Min("value"), pcu_max=Max("value"))
+    pcu_min = float(pcu_bounds["pcu_min"] or 0.0)
+    pcu_max = float(pcu_bounds["pcu_max"] or 0.0)
+
+    # Surveys without a stored MCI result are scored on demand, as before.
+    unscored_surveys = models.RoadConditionSurvey.objects.in_bulk(
+        [row[2] for row in road_rows if row[2] is not None and row[3] is None]
+    )
+
+    w1, w2, w3, w4, w5 = (weights[key] for key in ("w1", "w2", "w3", "w4", "w5"))
+    pcu_range = pcu_max - pcu_min
 
     created_results: List[models.PrioritizationResult] = []
     with transaction.atomic():
-        for road in models.Road.objects.select_related("socioeconomic"):
-            latest_survey = (
-                models.RoadConditionSurvey.objects.filter(road_segment__section__road=road)
-                .order_by("-inspection_date")
-                .first()
-            )
+        for road_id, population_served, latest_survey_id, mci_value, pcu_value, benefit_score in road_rows:
             cs_norm = 0.0
-            if latest_survey:
+            if mci_value is not None:
+                cs_norm = float(mci_value)
+            elif latest_survey_id in unscored_surveys:
                 try:
-                    result = getattr(latest_survey, "mci_result", None) or models.SegmentMCIResult.create_from_survey(
-                        latest_survey
-                    )
+                    result = models.SegmentMCIResult.create_from_survey(unscored_surveys[latest_survey_id])
                     cs_norm = float(result.mci_value) if result else 0.0
                 except ValueError:
                     cs_norm = 0.0
 
-            traffic_qs = traffic_models.TrafficForPrioritization.objects.filter(road=road)
-            if fiscal_year:
-                traffic_qs = traffic_qs.filter(fiscal_year=fiscal_year)
-            traffic_value = traffic_qs.filter(value_type="PCU").order_by("-fiscal_year").first()
-            pcu = float(traffic_value.value) if traffic_value else 0.0
-            if pcu_max != pcu_min:
-                pcu_norm = 100.0 * (pcu - pcu_min) / (pcu_max - pcu_min)
-                pcu_norm = max(0.0, min(100.0, pcu_norm))
+            pcu = float(pcu_value) if pcu_value is not None else 0.0
+            if pcu_range:
+                pcu_norm = max(0.0, min(100.0, 100.0 * (pcu - pcu_min) / pcu_range))
             else:
                 pcu_norm = 0.0
 
-            benefit = models.BenefitFactor.objects.filter(road=road).first()
-            has_ei = benefit and benefit.total_benefit_score is not None
-            ei = float(benefit.total_benefit_score) if has_ei else 0.0
+            has_ei = benefit_score is not None
+            ei = float(benefit_score) if has_ei else 0.0
 
             sr = 0.0  # Placeholder – safety risk scoring can be supplied later
             tlm_norm = 0.0  # Placeholder – months since last maintenance when data is available
 
-            priority_score = (
-                weights["w1"] * cs_norm
-                + weights["w2"] * pcu_norm
-                + weights["w3"] * ei
-                + weights["w4"] * sr
-                + weights["w5"] * tlm_norm
-            )
+            priority_score = w1 * cs_norm + w2 * pcu_norm + w3 * ei + w4 * sr + w5 * tlm_norm
 
-            models.PrioritizationResult.objects.filter(
-                road=road,
-                fiscal_year=fiscal_year or 0,
-            ).delete()
-
-            result = models.PrioritizationResult.objects.create(
-                road=road,
-                fiscal_year=fiscal_year or 0,
-                population_served=road.socioeconomic.population_served if hasattr(road, "socioeconomic") else None,
-                benefit_score=Decimal(f"{ei:.2f}") if has_ei else None,
-                improvement_cost=Decimal("0"),
-                ranking_index=Decimal(f"{priority_score:.4f}"),
-                priority_rank=0,
+            created_results.append(
+                models.PrioritizationResult(
+                    road_id=road_id,
+                    fiscal_year=fiscal_year or 0,
+                    population_served=population_served,
+                    benefit_score=Decimal(f"{ei:.2f}") if has_ei else None,
+                    improvement_cost=Decimal("0"),
+                    ranking_index=Decimal(f"{priority_score:.4f}"),
+                )
             )
-            created_results.append(result)
-
-            created_results.sort(key=lambda item: item.ranking_index, reverse=True)
-            for rank, result in enumerate(created_results, start=1):
-                result.priority_rank = rank
-                result.save(update_fields=["priority_rank"])
 
-    serializer = serializers.PrioritizationResultSerializer(created_results, many=True)
+        # Rank before inserting so each row is written once with its final rank.
+        created_results.sort(key=lambda item: item.ranking_index, reverse=True)
+        for rank, result in enumerate(created_results, start=1):
+            result.priority_rank = rank
+
+        # Every road is rescored, so clear the fiscal year in one statement and
+        # insert the new rows in batches rather than one query per road.
+        models.PrioritizationResult.objects.filter(fiscal_year=fiscal_year or 0).delete()
+        models.PrioritizationResult.objects.bulk_create(created_results, batch_size=1000)
+
+    # The serializer reads each road's link type; fetch the stored rows with
+    # that relation joined rather than lazily loading it per result.
+    ranked_results = (
+        models.PrioritizationResult.objects.filter(fiscal_year=fiscal_year or 0)
+        .select_related("road__socioeconomic__road_link_type")
+        .order_by("priority_rank")
+    )
+    serializer = serializers.PrioritizationResultSerializer(ranked_results, many=True)
     return Response(serializer.data)
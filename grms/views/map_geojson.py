@@ -1,15 +1,48 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections import defaultdict
 from decimal import Decimal
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 from django.contrib.admin.views.decorators import staff_member_required
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, quote_etag
 
 from grms import models
 from grms.gis.geojson import feature, feature_collection, to_4326
-from grms.utils import make_point, slice_geometry_by_chainage, slice_linestring_by_chainage, utm_to_wgs84
+from grms.signals import MAP_GEOJSON_CACHE_SECONDS, map_geojson_version, response_cache_enabled
+from grms.utils import (
+    make_point,
+    slice_geometry_by_chainage,
+    slice_linestring_by_chainage,
+    slice_linestring_by_chainages,
+    utm_to_wgs84,
+    utm_to_wgs84_many,
+)
+
+try:  # pragma: no cover - optional faster serialiser for large feature collections
+    import orjson
+except ImportError:  # pragma: no cover - DjangoJSONEncoder is used instead
+    orjson = None
+
+# Columns the geometry helpers below read; everything else is left unloaded.
+_SECTION_GEOMETRY_FIELDS = ("id", "road_id", "geometry", "start_chainage_km", "end_chainage_km")
+_SEGMENT_GEOMETRY_FIELDS = ("id", "station_from_km", "station_to_km")
+_STRUCTURE_GEOMETRY_FIELDS = (
+    "id",
+    "location_point",
+    "location_latitude",
+    "location_longitude",
+    "easting_m",
+    "northing_m",
+    "utm_zone",
+)
 
 
 def _as_float(value: Optional[Decimal]) -> Optional[float]:
@@ -21,46 +54,153 @@ def _as_float(value: Optional[Decimal]) -> Optional[float]:
         return None
 
 
+# feature() only copies extra properties, so one shared mapping serves every
+# feature without a geometry.
+_MISSING_GEOMETRY_PROPS = MappingProxyType({"warning": "missing_geometry"})
+
+
 def _warning_if_missing(geom):
-    return {"warning": "missing_geometry"} if geom is None else {}
+    return _MISSING_GEOMETRY_PROPS if geom is None else None
+
+
+_NOT_SLICED = object()
+
+
+def _chainage_range(start_value, end_value) -> Optional[Tuple[float, float]]:
+    start_km = _as_float(start_value)
+    end_km = _as_float(end_value)
+    if start_km is None or end_km is None:
+        return None
+    return start_km, end_km
+
+
+def _section_range(section: models.RoadSection) -> Optional[Tuple[float, float]]:
+    return _chainage_range(section.start_chainage_km, section.end_chainage_km)
+
 
+def _segment_range(segment: models.RoadSegment) -> Optional[Tuple[float, float]]:
+    return _chainage_range(segment.station_from_km, segment.station_to_km)
 
-def _section_geometry(section: models.RoadSection, road_geom):
+
+def _sliced_geometry(line_geom, chainage_range, sliced=_NOT_SLICED):
+    """Return the part of ``line_geom`` between the chainages in ``chainage_range``.
+
+    ``sliced`` is a precomputed :func:`slice_linestring_by_chainage` result for
+    callers that slice several ranges of the same line in one batch.
+    """
+
+    if not line_geom or chainage_range is None:
+        return None
+    start_km, end_km = chainage_range
+    if sliced is _NOT_SLICED:
+        sliced = slice_linestring_by_chainage(line_geom, start_km, end_km)
+    if not sliced:
+        return slice_geometry_by_chainage(line_geom, start_km, end_km) or None
+    return sliced.get("geometry")
+
+
+def _batch_slices(line_geom, items, range_of) -> Dict[int, object]:
+    """Slice ``line_geom`` for every item with a chainage range, keyed by item id.
+
+    The line is projected once and PostGIS is queried once, not per item.
+    """
+
+    if not line_geom:
+        return {}
+    ranges = {item.id: range_of(item) for item in items}
+    sliceable = [pk for pk, chainage_range in ranges.items() if chainage_range is not None]
+    return dict(zip(sliceable, slice_linestring_by_chainages(line_geom, [ranges[pk] for pk in sliceable])))
+
+
+def _section_geometry(section: models.RoadSection, road_geom, sliced=_NOT_SLICED):
     if section.geometry:
         return section.geometry
-    start_km = _as_float(section.start_chainage_km)
-    end_km = _as_float(section.end_chainage_km)
-    if road_geom and start_km is not None and end_km is not None:
-        sliced = slice_linestring_by_chainage(road_geom, start_km, end_km)
-        if not sliced:
-            sliced_geom = slice_geometry_by_chainage(road_geom, start_km, end_km)
-            if sliced_geom:
-                return sliced_geom
-        if sliced:
-            return sliced.get("geometry")
-    return None
+    return _sliced_geometry(road_geom, _section_range(section), sliced)
 
 
-def _segment_geometry(segment: models.RoadSegment, section_geom):
-    start_km = _as_float(segment.station_from_km)
-    end_km = _as_float(segment.station_to_km)
-    if section_geom and start_km is not None and end_km is not None:
-        sliced = slice_linestring_by_chainage(section_geom, start_km, end_km)
-        if not sliced:
-            sliced_geom = slice_geometry_by_chainage(section_geom, start_km, end_km)
-            if sliced_geom:
-                return sliced_geom
-        if sliced:
-            return sliced.get("geometry")
-    return None
+def _segment_geometry(segment: models.RoadSegment, section_geom, sliced=_NOT_SLICED):
+    return _sliced_geometry(section_geom, _segment_range(segment), sliced)
 
 
-def _structure_geometry(structure: models.StructureInventory):
+def _dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=DjangoJSONEncoder().default)
+    return json.dumps(payload, cls=DjangoJSONEncoder).encode()
+
+
+def _cached_geojson(request, name: str, build: Callable[[], dict], *key_parts) -> HttpResponse:
+    """Return the FeatureCollection from ``build``, cached as serialised JSON.
+
+    Keys carry the map GeoJSON version, which is bumped whenever a road,
+    section, segment or structure is saved or deleted. Without a shared cache
+    the collection is rebuilt on every request instead. Either way the payload
+    hash is sent as an ``ETag`` so map reloads with an unchanged copy get a 304.
+    """
+
+    cache_key = None
+    cached = None
+    if response_cache_enabled():
+        parts = ":".join("" if part is None else str(part) for part in key_parts)
+        cache_key = f"grms:map-geojson:{map_geojson_version()}:{name}:{parts}"
+        cached = cache.get(cache_key)
+    if cached is None:
+        payload = _dumps(build())
+        cached = (quote_etag(hashlib.md5(payload).hexdigest()), payload)
+        if cache_key is not None:
+            cache.set(cache_key, cached, MAP_GEOJSON_CACHE_SECONDS)
+
+    etag, payload = cached
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(payload, content_type="application/json")
+    response["ETag"] = etag
+    return response
+
+
+def _needs_utm(structure: models.StructureInventory) -> bool:
+    return (
+        not structure.location_point
+        and (structure.location_latitude is None or structure.location_longitude is None)
+        and structure.easting_m is not None
+        and structure.northing_m is not None
+    )
+
+
+def _batch_utm_points(structures: Sequence[models.StructureInventory]) -> Dict[int, Tuple[float, float]]:
+    """Convert the UTM-only structures with one transform per zone, keyed by id."""
+
+    by_zone = defaultdict(list)
+    for structure in structures:
+        if structure.utm_zone and _needs_utm(structure):
+            by_zone[structure.utm_zone].append(structure)
+
+    points: Dict[int, Tuple[float, float]] = {}
+    for zone, group in by_zone.items():
+        try:
+            converted = utm_to_wgs84_many(
+                [float(structure.easting_m) for structure in group],
+                [float(structure.northing_m) for structure in group],
+                zone=zone,
+            )
+        except Exception:
+            # Leave the group to the per-structure fallback below.
+            continue
+        points.update(zip((structure.id for structure in group), converted))
+    return points
+
+
+def _structure_geometry(
+    structure: models.StructureInventory,
+    utm_points: Optional[Dict[int, Tuple[float, float]]] = None,
+):
     if structure.location_point:
         return structure.location_point
     if structure.location_latitude is not None and structure.location_longitude is not None:
         return make_point(float(structure.location_latitude), float(structure.location_longitude))
     if structure.easting_m is not None and structure.northing_m is not None:
+        if utm_points and structure.id in utm_points:
+            lat, lng = utm_points[structure.id]
+            return make_point(lat, lng)
         try:
             lat, lng = utm_to_wgs84(float(structure.easting_m), float(structure.northing_m), zone=structure.utm_zone)
         except Exception:
@@ -71,24 +211,53 @@ def _structure_geometry(structure: models.StructureInventory):
 
 @staff_member_required
 def road_sections_geojson(request, road_id: int, current_section_id: Optional[int] = None):
-    road = get_object_or_404(models.Road, pk=road_id)
+    return _cached_geojson(
+        request,
+        "road-sections",
+        lambda: _road_sections_collection(road_id, current_section_id),
+        road_id,
+        current_section_id,
+    )
+
+
+def _road_sections_collection(road_id: int, current_section_id: Optional[int]) -> dict:
+    road = get_object_or_404(models.Road.objects.only("id", "geometry"), pk=road_id)
     road_geom = to_4326(road.geometry)
     features = [
         feature(road_geom, "road", road.id, _warning_if_missing(road_geom)),
     ]
 
-    sections = models.RoadSection.objects.filter(road_id=road_id).order_by("sequence_on_road", "id")
+    sections = list(
+        models.RoadSection.objects.filter(road_id=road_id)
+        .only(*_SECTION_GEOMETRY_FIELDS)
+        .order_by("sequence_on_road", "id")
+    )
+    unsliced = [section for section in sections if not section.geometry]
+    sliced_by_id = _batch_slices(road_geom, unsliced, _section_range)
     for section in sections:
-        geom = to_4326(_section_geometry(section, road_geom))
+        geom = to_4326(_section_geometry(section, road_geom, sliced_by_id.get(section.id, _NOT_SLICED)))
         role = "section_current" if current_section_id and section.id == current_section_id else "section"
         features.append(feature(geom, role, section.id, _warning_if_missing(geom)))
 
-    return JsonResponse(feature_collection(features))
+    return feature_collection(features)
 
 
 @staff_member_required
 def section_segments_geojson(request, section_id: int, current_segment_id: Optional[int] = None):
-    section = get_object_or_404(models.RoadSection.objects.select_related("road"), pk=section_id)
+    return _cached_geojson(
+        request,
+        "section-segments",
+        lambda: _section_segments_collection(section_id, current_segment_id),
+        section_id,
+        current_segment_id,
+    )
+
+
+def _section_segments_collection(section_id: int, current_segment_id: Optional[int]) -> dict:
+    section = get_object_or_404(
+        models.RoadSection.objects.select_related("road").only(*_SECTION_GEOMETRY_FIELDS, "road__id", "road__geometry"),
+        pk=section_id,
+    )
     road_geom = to_4326(section.road.geometry)
     features = [
         feature(road_geom, "road", section.road_id, _warning_if_missing(road_geom)),
@@ -97,13 +266,18 @@ def section_segments_geojson(request, section_id: int, current_segment_id: Optio
     section_geom = to_4326(_section_geometry(section, road_geom))
     features.append(feature(section_geom, "section_current", section.id, _warning_if_missing(section_geom)))
 
-    segments = models.RoadSegment.objects.filter(section_id=section_id).order_by("sequence_on_section", "id")
+    segments = list(
+        models.RoadSegment.objects.filter(section_id=section_id)
+        .only(*_SEGMENT_GEOMETRY_FIELDS)
+        .order_by("sequence_on_section", "id")
+    )
+    sliced_by_id = _batch_slices(section_geom, segments, _segment_range)
     for segment in segments:
-        geom = to_4326(_segment_geometry(segment, section_geom))
+        geom = to_4326(_segment_geometry(segment, section_geom, sliced_by_id.get(segment.id, _NOT_SLICED)))
         role = "segment_current" if current_segment_id and segment.id == current_segment_id else "segment"
         features.append(feature(geom, role, segment.id, _warning_if_missing(geom)))
 
-    return JsonResponse(feature_collection(features))
+    return feature_collection(features)
 
 
 @staff_member_required
@@ -113,7 +287,22 @@ def structure_geojson(
     section_id: Optional[int] = None,
     current_structure_id: Optional[int] = None,
 ):
-    road = get_object_or_404(models.Road, pk=road_id)
+    return _cached_geojson(
+        request,
+        "structures",
+        lambda: _structures_collection(road_id, section_id, current_structure_id),
+        road_id,
+        section_id,
+        current_structure_id,
+    )
+
+
+def _structures_collection(
+    road_id: int,
+    section_id: Optional[int],
+    current_structure_id: Optional[int],
+) -> dict:
+    road = get_object_or_404(models.Road.objects.only("id", "geometry"), pk=road_id)
     road_geom = to_4326(road.geometry)
     features = [
         feature(road_geom, "road", road.id, _warning_if_missing(road_geom)),
@@ -121,16 +310,22 @@ def structure_geojson(
 
     section_geom = None
     if section_id:
-        section = get_object_or_404(models.RoadSection, pk=section_id, road_id=road_id)
+        section = get_object_or_404(
+            models.RoadSection.objects.only(*_SECTION_GEOMETRY_FIELDS),
+            pk=section_id,
+            road_id=road_id,
+        )
         section_geom = to_4326(_section_geometry(section, road_geom))
         features.append(feature(section_geom, "section_current", section.id, _warning_if_missing(section_geom)))
 
-    structures_qs = models.StructureInventory.objects.filter(road_id=road_id)
+    structures_qs = models.StructureInventory.objects.filter(road_id=road_id).only(*_STRUCTURE_GEOMETRY_FIELDS)
     if section_id:
         structures_qs = structures_qs.filter(section_id=section_id)
 
-    for structure in structures_qs.order_by("id"):
-        geom = to_4326(_structure_geometry(structure))
+    structures = list(structures_qs.order_by("id"))
+    utm_points = _batch_utm_points(structures)
+    for structure in structures:
+        geom = to_4326(_structure_geometry(structure, utm_points))
         role = (
             "structure_current"
             if current_structure_id and structure.id == current_structure_id
@@ -138,4 +333,4 @@ def structure_geojson(
         )
         features.append(feature(geom, role, structure.id, _warning_if_missing(geom)))
 
-    return JsonResponse(feature_collection(features))
+    return feature_collection(features)
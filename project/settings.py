@@ -151,6 +151,28 @@ USE_TZ = True
 STATIC_URL = '/static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# The lookup-list and map GeoJSON response caches are invalidated by writing
+# to the default cache (grms.signals), from web workers and from the import
+# commands alike. That only works when every process shares the cache, so
+# those caches stay off (SHARED_CACHE is False) until REDIS_URL points the
+# default cache at Redis. The per-process LocMemCache below is still used for
+# TTL-bound lookups such as Google viewports and directions.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+SHARED_CACHE = bool(REDIS_URL)
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
@@ -1,7 +1,8 @@
 
 import csv
 import re
-from decimal import Decimal, InvalidOperation
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
@@ -17,6 +18,7 @@ from grms.models import (
     RoadSocioEconomic,
     StructureInventory,
 )
+from grms.signals import bump_map_geojson_version
 from traffic import models as traffic_models
 
 
@@ -27,6 +29,51 @@ STRUCTURE_FILE = "Datas/structures_seed.csv"
 TRAFFIC_FILE = "Datas/traffic_seed.csv"
 SOCIO_FILE = "Datas/road_socioeconomic_seed.csv"
 
+ROAD_UPDATE_FIELDS = [
+    "road_name_from",
+    "road_name_to",
+    "design_standard",
+    "admin_zone",
+    "admin_woreda",
+    "total_length_km",
+    "start_easting",
+    "start_northing",
+    "end_easting",
+    "end_northing",
+    "surface_type",
+    "managing_authority",
+]
+
+SECTION_UPDATE_FIELDS = [
+    "sequence_on_road",
+    "section_number",
+    "start_chainage_km",
+    "end_chainage_km",
+    "length_km",
+    "surface_type",
+    "surface_thickness_cm",
+]
+
+SEGMENT_UPDATE_FIELDS = [
+    "sequence_on_section",
+    "segment_identifier",
+    "station_from_km",
+    "station_to_km",
+    "cross_section",
+    "terrain_transverse",
+    "terrain_longitudinal",
+    "ditch_left_present",
+    "ditch_right_present",
+    "shoulder_left_present",
+    "shoulder_right_present",
+    "carriageway_width_m",
+    "comment",
+]
+
+# RoadSegment stations are numeric(8, 3). PostgreSQL rounds ties away from
+# zero when storing them (Django passes the Decimal through unchanged), so the
+# preloaded index rounds both the stored and the parsed stations the same way.
+STATION_QUANTUM = Decimal("0.001")
 
 def _normalize_name(value: str) -> str:
     return re.sub(r"[^a-z0-9]", "", (value or "").lower())
@@ -40,41 +87,53 @@ def _normalize_road_norm(value: str) -> str:
     return _normalize_name(value or "")
 
 
-def _parse_decimal(value, *, default=None) -> Decimal | None:
-    if value is None:
-        return default
-    text = str(value).strip()
+@lru_cache(maxsize=4096)
+def _decimal_from_text(text: str) -> Decimal | None:
+    # Chainages, widths and counts repeat heavily across rows, and Decimal is
+    # immutable, so parsed values are shared instead of rebuilt per cell.
+    text = text.strip()
     if text == "" or text.lower() == "nan":
-        return default
+        return None
     try:
         return Decimal(text)
     except InvalidOperation:
+        return None
+
+
+def _parse_decimal(value, *, default=None) -> Decimal | None:
+    if value is None:
         return default
+    parsed = _decimal_from_text(value if isinstance(value, str) else str(value))
+    return default if parsed is None else parsed
 
 
 def _parse_int(value, *, default=None):
     if value is None:
         return default
-    text = str(value).strip()
-    if text == "" or text.lower() == "nan":
+    parsed = _decimal_from_text(value if isinstance(value, str) else str(value))
+    if parsed is None:
         return default
     try:
-        return int(Decimal(text))
-    except (InvalidOperation, ValueError):
+        return int(parsed)
+    except ValueError:
         return default
 
 
+def _station_key(value: Decimal) -> Decimal:
+    return value.quantize(STATION_QUANTUM, rounding=ROUND_HALF_UP)
+
+
 def _parse_bool(value) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "y", "t"}
 
 
-def _next_road_identifier(existing_ids: set[str]) -> str:
+def _max_road_number(existing_ids: set[str]) -> int:
     max_num = 0
     for rid in existing_ids:
         match = re.match(r"RTR-(\d+)", rid or "")
         if match:
             max_num = max(max_num, int(match.group(1)))
-    return f"RTR-{max_num + 1}"
+    return max_num
 
 
 class Command(BaseCommand):
@@ -146,6 +205,8 @@ class Command(BaseCommand):
             self._seed_segments(file_paths[SEGMENT_FILE], section_map, summary, warnings, wipe)
             self._seed_structures(file_paths[STRUCTURE_FILE], section_map, summary, warnings)
             self._seed_traffic(file_paths[TRAFFIC_FILE], road_map, summary, warnings)
+            # The bulk writes above skip the signals that expire the cached map.
+            transaction.on_commit(bump_map_geojson_version)
         self._seed_socio(file_paths[SOCIO_FILE], road_map, summary, warnings)
 
         if dry_run:
@@ -170,50 +231,68 @@ class Command(BaseCommand):
             _normalize_road_key(road.road_name_from, road.road_name_to): road for road in existing_roads
         }
 
+        # New identifiers continue from the highest existing RTR number.
+        road_number = _max_road_number(existing_ids)
+        to_update: dict[int, Road] = {}
+
         road_map: dict[str, Road] = {}
         with path.open(newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                road_norm = _normalize_road_norm(row.get("road_name_norm"))
-                road_from = row.get("road_from") or row.get("road_name_from") or row.get("road_from".upper())
-                road_to = row.get("road_to") or row.get("road_name_to") or row.get("road_to".upper())
-                road_from = (road_from or "").strip()
-                road_to = (road_to or "").strip()
-
-                zone_name = (row.get("zone") or "").strip() or "Unknown"
-                admin_zone, _ = AdminZone.objects.get_or_create(name=zone_name)
-
-                defaults = {
-                    "road_name_from": road_from,
-                    "road_name_to": road_to,
-                    "design_standard": "Basic Access",
-                    "admin_zone": admin_zone,
-                    "admin_woreda": None,
-                    "total_length_km": _parse_decimal(row.get("length_km_cs")) or Decimal("0"),
-                    "start_easting": _parse_decimal(row.get("start_e")),
-                    "start_northing": _parse_decimal(row.get("start_n")),
-                    "end_easting": _parse_decimal(row.get("end_e")),
-                    "end_northing": _parse_decimal(row.get("end_n")),
-                    "surface_type": "Gravel",
-                    "managing_authority": "Regional",
-                }
-
-                existing = road_by_norm.get(road_norm)
-                if existing:
-                    Road.objects.filter(pk=existing.pk).update(**defaults)
-                    existing.refresh_from_db()
-                    road_map[road_norm] = existing
-                    summary["roads_updated"] += 1
-                    continue
-
-                road_identifier = _next_road_identifier(existing_ids)
-                existing_ids.add(road_identifier)
-                defaults["road_identifier"] = road_identifier
-
-                road = Road.objects.create(**defaults)
-                road_map[road_norm] = road
-                summary["roads_created"] += 1
-
+            rows = list(csv.DictReader(handle))
+
+        # dict keeps first-seen order, so new zones are numbered as before.
+        zone_names = dict.fromkeys((row.get("zone") or "").strip() or "Unknown" for row in rows)
+        zones = AdminZone.objects.in_bulk(zone_names, field_name="name")
+        missing_zones = [name for name in zone_names if name not in zones]
+        if missing_zones:
+            AdminZone.objects.bulk_create([AdminZone(name=name) for name in missing_zones], ignore_conflicts=True)
+            # ignore_conflicts leaves pks unset, so read the new rows back.
+            zones.update(AdminZone.objects.in_bulk(missing_zones, field_name="name"))
+
+        for row in rows:
+            road_norm = _normalize_road_norm(row.get("road_name_norm"))
+            road_from = row.get("road_from") or row.get("road_name_from") or row.get("road_from".upper())
+            road_to = row.get("road_to") or row.get("road_name_to") or row.get("road_to".upper())
+            road_from = (road_from or "").strip()
+            road_to = (road_to or "").strip()
+
+            zone_name = (row.get("zone") or "").strip() or "Unknown"
+            admin_zone = zones[zone_name]
+
+            defaults = {
+                "road_name_from": road_from,
+                "road_name_to": road_to,
+                "design_standard": "Basic Access",
+                "admin_zone": admin_zone,
+                "admin_woreda": None,
+                "total_length_km": _parse_decimal(row.get("length_km_cs")) or Decimal("0"),
+                "start_easting": _parse_decimal(row.get("start_e")),
+                "start_northing": _parse_decimal(row.get("start_n")),
+                "end_easting": _parse_decimal(row.get("end_e")),
+                "end_northing": _parse_decimal(row.get("end_n")),
+                "surface_type": "Gravel",
+                "managing_authority": "Regional",
+            }
+
+            existing = road_by_norm.get(road_norm)
+            if existing:
+                for field, value in defaults.items():
+                    setattr(existing, field, value)
+                to_update[existing.pk] = existing
+                road_map[road_norm] = existing
+                summary["roads_updated"] += 1
+                continue
+
+            road_number += 1
+            defaults["road_identifier"] = f"RTR-{road_number}"
+
+            # New roads go through Road.save(), which derives the WGS84
+            # endpoints from the UTM inputs.
+            road = Road.objects.create(**defaults)
+            road_map[road_norm] = road
+            summary["roads_created"] += 1
+
+        # Existing roads are updated in place without Road.save(), batched.
+        Road.objects.bulk_update(list(to_update.values()), fields=ROAD_UPDATE_FIELDS, batch_size=1000)
         return road_map
 
     def _seed_sections(
@@ -223,7 +302,13 @@ class Command(BaseCommand):
         summary: dict,
         warnings: list[str],
     ) -> dict[tuple[str, int], RoadSection]:
-        section_map: dict[tuple[str, int], RoadSection] = {}
+        section_map: dict[tuple[str, int], tuple[int, int]] = {}
+        existing_sections = {
+            (section.road_id, section.section_number): section
+            for section in RoadSection.objects.filter(road__in=list(road_map.values()))
+        }
+        to_create: dict[tuple[int, int], RoadSection] = {}
+        to_update: dict[int, RoadSection] = {}
 
         with path.open(newline="", encoding="utf-8") as handle:
             reader = csv.DictReader(handle)
@@ -247,7 +332,6 @@ class Command(BaseCommand):
                 surface_type = road.surface_type or "Gravel"
                 surface_thickness = Decimal("0") if surface_type in {"Gravel", "DBST", "Asphalt", "Sealed"} else None
 
-                existing = RoadSection.objects.filter(road=road, section_number=section_no).first()
                 update_values = {
                     "sequence_on_road": section_no,
                     "section_number": section_no,
@@ -258,19 +342,29 @@ class Command(BaseCommand):
                     "surface_thickness_cm": surface_thickness,
                 }
 
+                key = (road.pk, section_no)
+                existing = existing_sections.get(key) or to_create.get(key)
                 if existing:
-                    RoadSection.objects.filter(pk=existing.pk).update(**update_values)
-                    existing.refresh_from_db()
-                    section_map[(road_norm, section_no)] = existing
+                    for field, value in update_values.items():
+                        setattr(existing, field, value)
+                    if existing.pk:
+                        to_update[existing.pk] = existing
                     summary["sections_updated"] += 1
                 else:
-                    obj = RoadSection(road=road, **update_values)
-                    RoadSection.objects.bulk_create([obj])
-                    created = RoadSection.objects.get(road=road, section_number=section_no)
-                    section_map[(road_norm, section_no)] = created
+                    to_create[key] = RoadSection(road=road, **update_values)
                     summary["sections_created"] += 1
+                section_map[(road_norm, section_no)] = key
+
+        # Both paths skip RoadSection.save(), as the per-row queries did.
+        RoadSection.objects.bulk_update(list(to_update.values()), fields=SECTION_UPDATE_FIELDS, batch_size=1000)
+        RoadSection.objects.bulk_create(list(to_create.values()), batch_size=1000)
 
-        return section_map
+        # Reload once so callers see the stored (rounded) chainages and lengths.
+        stored = {
+            (section.road_id, section.section_number): section
+            for section in RoadSection.objects.filter(road__in=list(road_map.values())).select_related("road")
+        }
+        return {map_key: stored[key] for map_key, key in section_map.items()}
 
     def _seed_segments(
         self,
@@ -300,15 +394,26 @@ class Command(BaseCommand):
         }
         terrain_map = {"F": "Flat", "R": "Rolling", "M": "Mountainous"}
 
+        existing_segments: dict[tuple[int, Decimal, Decimal], int] = {}
+        if wipe:
+            RoadSegment.objects.filter(section__in=[section_map[key] for key in segment_rows]).delete()
+        else:
+            existing_segments = {
+                (section_id, _station_key(station_from), _station_key(station_to)): pk
+                for pk, section_id, station_from, station_to in RoadSegment.objects.filter(
+                    section__in=[section_map[key] for key in segment_rows]
+                ).values_list("id", "section_id", "station_from_km", "station_to_km")
+            }
+
+        to_create: dict[tuple[str, int], list[RoadSegment]] = {}
+        to_update: dict[tuple[str, int], dict[int, RoadSegment]] = {}
         for key, rows in segment_rows.items():
             road_norm, section_no = key
             section = section_map[key]
+            section_creates = to_create.setdefault(key, [])
+            section_updates = to_update.setdefault(key, {})
             rows.sort(key=lambda r: _parse_decimal(r.get("station_from_km")) or Decimal("0"))
 
-            if wipe:
-                RoadSegment.objects.filter(section=section).delete()
-
-            to_create = []
             for idx, row in enumerate(rows, start=1):
                 station_from = _parse_decimal(row.get("station_from_km")) or Decimal("0")
                 station_to = _parse_decimal(row.get("station_to_km")) or Decimal("0")
@@ -340,27 +445,59 @@ class Command(BaseCommand):
                     "comment": "" if (row.get("comment") or "").lower() == "nan" else (row.get("comment") or ""),
                 }
 
-                existing = RoadSegment.objects.filter(
-                    section=section,
-                    station_from_km=station_from,
-                    station_to_km=station_to,
-                ).first()
-                if existing and not wipe:
-                    try:
-                        RoadSegment.objects.filter(pk=existing.pk).update(**update_values)
-                        summary["segments_updated"] += 1
-                    except IntegrityError as exc:
-                        raise CommandError(
-                            f"Segment update failed for {segment_identifier}. "
-                            "Try using --wipe-road-data."
-                        ) from exc
+                existing_pk = existing_segments.get(
+                    (section.pk, _station_key(station_from), _station_key(station_to))
+                )
+                if existing_pk is not None:
+                    # A repeated CSV row overwrites the pending values, as the
+                    # second per-row UPDATE used to.
+                    section_updates[existing_pk] = RoadSegment(pk=existing_pk, **update_values)
+                    summary["segments_updated"] += 1
                 else:
-                    obj = RoadSegment(section=section, **update_values)
-                    to_create.append(obj)
+                    section_creates.append(RoadSegment(section=section, **update_values))
+
+        try:
+            # A savepoint, so a failed batch can be replayed section by section.
+            with transaction.atomic():
+                self._write_segments(
+                    [obj for updates in to_update.values() for obj in updates.values()],
+                    [obj for creates in to_create.values() for obj in creates],
+                )
+        except IntegrityError as exc:
+            failing = self._find_failing_segment_section(segment_rows, section_map, to_update, to_create)
+            raise CommandError(f"Segment write failed for {failing}. Try using --wipe-road-data.") from exc
+        summary["segments_created"] += sum(len(creates) for creates in to_create.values())
+
+    @staticmethod
+    def _write_segments(updates: list[RoadSegment], creates: list[RoadSegment]):
+        # Updates go first so renumbered rows free their sequence_on_section
+        # slots before new segments claim them.
+        if updates:
+            RoadSegment.objects.bulk_update(updates, fields=SEGMENT_UPDATE_FIELDS, batch_size=1000)
+        if creates:
+            RoadSegment.objects.bulk_create(creates, batch_size=1000)
+
+    def _find_failing_segment_section(
+        self,
+        segment_rows: dict[tuple[str, int], list[dict]],
+        section_map: dict[tuple[str, int], RoadSection],
+        to_update: dict[tuple[str, int], dict[int, RoadSegment]],
+        to_create: dict[tuple[str, int], list[RoadSegment]],
+    ) -> str:
+        """Name the first section whose segment writes fail on their own."""
 
-            if to_create:
-                RoadSegment.objects.bulk_create(to_create)
-                summary["segments_created"] += len(to_create)
+        for key, rows in segment_rows.items():
+            try:
+                with transaction.atomic():
+                    self._write_segments(list(to_update[key].values()), to_create[key])
+                    transaction.set_rollback(True)
+            except IntegrityError:
+                section = section_map[key]
+                return (
+                    f"{section.road.road_identifier}-S{section.sequence_on_road} "
+                    f"('{rows[0].get('road_name_norm')}' S{key[1]})"
+                )
+        return "the seeded sections"
 
     def _seed_structures(
         self,
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("traffic", "0007_alter_trafficsurveysummary_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="trafficforprioritization",
+            index=models.Index(
+                fields=["road", "value_type", "fiscal_year"],
+                name="traffic_for_road_id_a18cd2_idx",
+            ),
+        ),
+    ]
@@ -466,6 +466,9 @@ class TrafficForPrioritization(models.Model):
     class Meta:
         db_table = "traffic_for_prioritization"
         unique_together = ("road", "fiscal_year", "is_active")
+        indexes = [
+            models.Index(fields=["road", "value_type", "fiscal_year"]),
+        ]
         verbose_name = "Traffic value for prioritization"
         verbose_name_plural = "Traffic values for prioritization"
 